@@ -26,6 +26,17 @@ settings = get_settings()
 
 MAX_TOOL_ITERATIONS = 5
 
+# Response budgets are read once at import; Settings is cached for the process lifetime.
+MAX_OUTPUT_TOKENS = max(128, min(settings.ASSISTANT_MAX_OUTPUT_TOKENS, 2048))
+MAX_OUTPUT_WORDS = max(40, settings.ASSISTANT_MAX_OUTPUT_WORDS)
+
+BUDGETED_SYSTEM_PROMPT = (
+    SYSTEM_PROMPT
+    + f"\n\nResponse Budget:\n- Hard cap: {MAX_OUTPUT_WORDS} words\n"
+    "- Be direct and straight to the point.\n"
+    "- Only go beyond this if the user explicitly asks for detailed analysis."
+)
+
 PROVIDER_CONFIG = {
     "openrouter": {
         "base_url": "https://openrouter.ai/api/v1",
@@ -54,8 +65,8 @@ class TaxAssistant:
             api_key=config["api_key"],
         )
         self.model = settings.LLM_MODEL
-        self.max_output_tokens = max(128, min(settings.ASSISTANT_MAX_OUTPUT_TOKENS, 2048))
-        self.max_output_words = max(40, settings.ASSISTANT_MAX_OUTPUT_WORDS)
+        self.max_output_tokens = MAX_OUTPUT_TOKENS
+        self.max_output_words = MAX_OUTPUT_WORDS
         self._rag_enabled = settings.ASSISTANT_ENABLE_RAG
 
     def enable_rag(self):
@@ -70,12 +81,7 @@ class TaxAssistant:
     ) -> list[dict]:
         messages = []
 
-        system_content = (
-            SYSTEM_PROMPT
-            + f"\n\nResponse Budget:\n- Hard cap: {self.max_output_words} words\n"
-            "- Be direct and straight to the point.\n"
-            "- Only go beyond this if the user explicitly asks for detailed analysis."
-        )
+        system_content = BUDGETED_SYSTEM_PROMPT
 
         if user_profile:
             system_content += "\n\n" + USER_PROFILE_TEMPLATE.format(
@@ -7,10 +7,9 @@ Each tool has a schema (for the LLM) and an execute function (for the backend).
 import json
 from dataclasses import asdict
 
-from app.core.tax_rules.pit import PITCalculator, Deductions
-from app.core.tax_rules.cit import CITCalculator
-from app.core.tax_rules.vat import VATCalculator
-from app.core.tax_rules.wht import WHTCalculator, WHTPaymentType, RecipientType
+from app.core.tax_rules import pit_calc, cit_calc, vat_calc, wht_calc
+from app.core.tax_rules.pit import Deductions
+from app.core.tax_rules.wht import WHTPaymentType, RecipientType
 from app.core.currency import CurrencyEngine
 from app.core.classifier import TransactionClassifier
 from app.core.scenario import ScenarioModeler
@@ -228,10 +227,6 @@ TOOL_DEFINITIONS = [
 ]
 
 
-pit_calc = PITCalculator()
-cit_calc = CITCalculator()
-vat_calc = VATCalculator()
-wht_calc = WHTCalculator()
 currency_engine = CurrencyEngine()
 classifier = TransactionClassifier()
 scenario_modeler = ScenarioModeler()
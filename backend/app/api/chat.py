@@ -18,6 +18,9 @@ router = APIRouter()
 settings = get_settings()
 assistant = TaxAssistant()
 
+# Columns needed to replay history to the model; skips the TOASTed tool_calls/tool_results JSONB.
+HISTORY_COLUMNS = "role,content"
+
 def get_user_record(current_user) -> dict | None:
     """Get the current user's row from public.users."""
     admin_client = get_supabase_admin()
@@ -62,7 +65,7 @@ async def send_message(data: ChatMessageCreate, current_user=Depends(get_current
             if not conversation or not conversation.data:
                 raise HTTPException(status_code=404, detail="Conversation not found")
 
-            messages_result = supabase.table("chat_messages").select("*").eq(
+            messages_result = supabase.table("chat_messages").select(HISTORY_COLUMNS).eq(
                 "conversation_id", str(conversation_id)
             ).order("created_at").execute()
 
@@ -152,7 +155,7 @@ async def stream_message(data: ChatMessageCreate, current_user=Depends(get_curre
                 if not conversation or not conversation.data:
                     raise HTTPException(status_code=404, detail="Conversation not found")
 
-            messages_result = supabase.table("chat_messages").select("*").eq(
+            messages_result = supabase.table("chat_messages").select(HISTORY_COLUMNS).eq(
                 "conversation_id", str(conversation_id)
             ).order("created_at").execute()
 
@@ -10,13 +10,11 @@ from fastapi import APIRouter, HTTPException, Depends
 from app.api.auth import get_current_user, get_supabase_admin
 from app.schemas.schemas import ReportRequest
 from app.core.reports import ReportGenerator
-from app.core.tax_rules.pit import PITCalculator, Deductions
-from app.core.tax_rules.cit import CITCalculator
+from app.core.tax_rules import pit_calc, cit_calc
+from app.core.tax_rules.pit import Deductions
 
 router = APIRouter()
 report_gen = ReportGenerator()
-pit_calc = PITCalculator()
-cit_calc = CITCalculator()
 
 
 @router.post("/generate")
@@ -45,10 +43,12 @@ async def generate_report(data: ReportRequest, current_user=Depends(get_current_
         if data.report_type == "tax_summary":
             transactions = []
             if user_uuid:
-                txn_result = supabase.table("transactions").select("*").eq(
+                txn_result = supabase.table("transactions").select(
+                    "transaction_type,amount_ngn,income_category"
+                ).eq(
                     "user_id", user_uuid
-                ).gte("transaction_date", f"{data.year}-01-01").lte(
-                    "transaction_date", f"{data.year}-12-31"
+                ).gte("transaction_date", f"{data.year}-01-01").lt(
+                    "transaction_date", f"{data.year + 1}-01-01"
                 ).execute()
                 transactions = txn_result.data or []
 
@@ -15,19 +15,14 @@ from app.schemas.schemas import (
     WHTCalculateRequest,
     ScenarioRequest,
 )
-from app.core.tax_rules.pit import PITCalculator, Deductions
-from app.core.tax_rules.cit import CITCalculator
-from app.core.tax_rules.vat import VATCalculator
-from app.core.tax_rules.wht import WHTCalculator, WHTPaymentType, RecipientType
+from app.core.tax_rules import pit_calc, cit_calc, vat_calc, wht_calc
+from app.core.tax_rules.pit import Deductions
+from app.core.tax_rules.wht import WHTPaymentType, RecipientType
 from app.core.scenario import ScenarioModeler
 from app.core.anomaly import AnomalyDetector
 
 router = APIRouter()
 
-pit_calc = PITCalculator()
-cit_calc = CITCalculator()
-vat_calc = VATCalculator()
-wht_calc = WHTCalculator()
 scenario_modeler = ScenarioModeler()
 anomaly_detector = AnomalyDetector()
 
@@ -102,6 +97,7 @@ async def run_scenario(data: ScenarioRequest):
             result = scenario_modeler.compare_income_change(
                 current_income=data.current_income,
                 projected_income=data.projected_income or data.current_income,
+                include_insights=data.include_insights,
             )
         elif data.scenario_type == "deduction_impact":
             current_ded = Deductions(**(data.current_deductions or {}))
@@ -110,11 +106,13 @@ async def run_scenario(data: ScenarioRequest):
                 gross_income=data.current_income,
                 current_deductions=current_ded,
                 projected_deductions=projected_ded,
+                include_insights=data.include_insights,
             )
         elif data.scenario_type == "individual_vs_company":
             result = scenario_modeler.compare_individual_vs_company(
                 gross_income=data.current_income,
                 business_expenses=data.business_expenses,
+                include_insights=data.include_insights,
             )
         else:
             raise HTTPException(status_code=400, detail=f"Unknown scenario type: {data.scenario_type}")
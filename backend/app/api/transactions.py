@@ -9,15 +9,30 @@ from fastapi import APIRouter, HTTPException, Depends, Query
 
 from app.config import get_settings
 from app.api.auth import get_current_user, get_supabase, get_supabase_admin
-from app.schemas.schemas import TransactionCreate, TransactionResponse, TransactionListResponse
+from app.schemas.schemas import (
+    TransactionCreate,
+    TransactionBulkCreate,
+    TransactionResponse,
+    TransactionListResponse,
+    TransactionType,
+)
 from app.core.currency import CurrencyEngine
-from app.core.classifier import TransactionClassifier
+from app.core.classifier import TransactionClassifier, ClassificationResult
+from app.models.transaction import ExpenseCategory, IncomeCategory
 
 router = APIRouter()
 settings = get_settings()
 currency_engine = CurrencyEngine()
 classifier = TransactionClassifier()
 
+# The summary reads the trigger-maintained monthly rollups (migration 004), not raw transactions.
+SUMMARY_COLUMNS = "transaction_type,category,total_ngn,transaction_count"
+SUMMARY_PAGE_SIZE = 1000  # Supabase caps PostgREST responses at 1000 rows by default
+
+# Classifier suggestions (e.g. "transfer") outside the DB enums are stored as "other".
+INCOME_CATEGORY_VALUES = frozenset(c.value for c in IncomeCategory)
+EXPENSE_CATEGORY_VALUES = frozenset(c.value for c in ExpenseCategory)
+
 def get_user_uuid(supabase, current_user) -> str:
     """Get the user's UUID from public.users table using supabase_id."""
     jwt_user_id = str(current_user.id)
@@ -35,6 +50,49 @@ def get_user_uuid(supabase, current_user) -> str:
     return user_lookup.data["id"]
 
 
+def build_transaction_row(
+    data: TransactionCreate,
+    user_uuid: str,
+    classification: ClassificationResult,
+    source: str = "manual",
+) -> dict:
+    """Convert and merge a new transaction with its classification into an insertable row."""
+    is_income = data.transaction_type is TransactionType.INCOME
+    currency = data.currency.value
+
+    conversion = currency_engine.convert_to_ngn(
+        amount=data.amount,
+        currency=currency,
+        rate_date=data.transaction_date,
+    )
+
+    suggested = classification.suggested_category
+    income_category = data.income_category or (
+        (suggested if suggested in INCOME_CATEGORY_VALUES else IncomeCategory.OTHER.value) if is_income else None
+    )
+    expense_category = data.expense_category or (
+        None if is_income else (suggested if suggested in EXPENSE_CATEGORY_VALUES else ExpenseCategory.OTHER.value)
+    )
+
+    return {
+        "user_id": user_uuid,
+        "transaction_type": data.transaction_type.value,
+        "description": data.description,
+        "amount": data.amount,
+        "currency": currency,
+        "amount_ngn": conversion.ngn_amount,
+        "exchange_rate": conversion.exchange_rate,
+        "transaction_date": data.transaction_date.isoformat(),
+        "income_category": income_category,
+        "expense_category": expense_category,
+        "is_vat_applicable": data.is_vat_applicable or classification.is_vat_applicable,
+        "is_wht_applicable": data.is_wht_applicable or classification.is_wht_applicable,
+        "is_capital": data.is_capital or classification.is_capital,
+        "source": source,
+        "ai_classified": not (data.income_category or data.expense_category),
+    }
+
+
 @router.post("/", response_model=TransactionResponse)
 async def create_transaction(data: TransactionCreate, current_user=Depends(get_current_user)):
     """Create a new transaction with automatic currency conversion and classification."""
@@ -43,42 +101,12 @@ async def create_transaction(data: TransactionCreate, current_user=Depends(get_c
     try:
         user_uuid = get_user_uuid(supabase, current_user)
 
-        conversion = currency_engine.convert_to_ngn(
-            amount=data.amount,
-            currency=data.currency.value,
-            rate_date=data.transaction_date,
-        )
-
         classification = classifier.classify(
             description=data.description,
             amount=data.amount,
-            is_credit=data.transaction_type.value == "income",
+            is_credit=data.transaction_type is TransactionType.INCOME,
         )
-
-        income_category = data.income_category or (
-            classification.suggested_category if data.transaction_type.value == "income" else None
-        )
-        expense_category = data.expense_category or (
-            classification.suggested_category if data.transaction_type.value == "expense" else None
-        )
-
-        transaction_data = {
-            "user_id": user_uuid,
-            "transaction_type": data.transaction_type.value,
-            "description": data.description,
-            "amount": data.amount,
-            "currency": data.currency.value,
-            "amount_ngn": conversion.ngn_amount,
-            "exchange_rate": conversion.exchange_rate,
-            "transaction_date": data.transaction_date.isoformat(),
-            "income_category": income_category,
-            "expense_category": expense_category,
-            "is_vat_applicable": data.is_vat_applicable or classification.is_vat_applicable,
-            "is_wht_applicable": data.is_wht_applicable or classification.is_wht_applicable,
-            "is_capital": data.is_capital or classification.is_capital,
-            "source": "manual",
-            "ai_classified": not (data.income_category or data.expense_category),
-        }
+        transaction_data = build_transaction_row(data, user_uuid, classification)
 
         result = supabase.table("transactions").insert(transaction_data).execute()
 
@@ -93,6 +121,36 @@ async def create_transaction(data: TransactionCreate, current_user=Depends(get_c
         raise HTTPException(status_code=400, detail=f"Failed to create transaction: {str(e)}")
 
 
+@router.post("/bulk", response_model=list[TransactionResponse])
+async def create_transactions_bulk(data: TransactionBulkCreate, current_user=Depends(get_current_user)):
+    """Create many transactions (e.g. a statement import) in a single insert round trip."""
+    supabase = get_supabase_admin()
+
+    try:
+        user_uuid = get_user_uuid(supabase, current_user)
+
+        classifications = classifier.classify_batch(
+            (t.description for t in data.transactions),
+            (t.transaction_type is TransactionType.INCOME for t in data.transactions),
+        )
+        rows = [
+            build_transaction_row(t, user_uuid, classification, source="import")
+            for t, classification in zip(data.transactions, classifications)
+        ]
+
+        result = supabase.table("transactions").insert(rows).execute()
+
+        if not result.data:
+            raise HTTPException(status_code=500, detail="Failed to create transactions")
+
+        return result.data
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to create transactions: {str(e)}")
+
+
 @router.get("/", response_model=TransactionListResponse)
 async def list_transactions(
     current_user=Depends(get_current_user),
@@ -214,11 +272,11 @@ async def delete_transaction(transaction_id: UUID, current_user=Depends(get_curr
 
     try:
         user_uuid = get_user_uuid(supabase, current_user)
-        result = supabase.table("transactions").delete().eq(
-            "id", str(transaction_id)
-        ).eq("user_id", user_uuid).execute()
+        result = supabase.table("transactions").delete(
+            count="exact", returning="minimal"
+        ).eq("id", str(transaction_id)).eq("user_id", user_uuid).execute()
 
-        if not result.data:
+        if not result.count:
             raise HTTPException(status_code=404, detail="Transaction not found")
 
         return {"message": "Transaction deleted successfully"}
@@ -239,35 +297,47 @@ async def get_transaction_summary(
 
     try:
         user_uuid = get_user_uuid(supabase, current_user)
-        query = supabase.table("transactions").select("*").eq(
-            "user_id", user_uuid
-        )
-
-        if year:
-            query = query.gte("transaction_date", f"{year}-01-01").lte("transaction_date", f"{year}-12-31")
-
-        result = query.execute()
-        transactions = result.data or []
-
-        total_income = sum(t["amount_ngn"] for t in transactions if t["transaction_type"] == "income")
-        total_expenses = sum(t["amount_ngn"] for t in transactions if t["transaction_type"] == "expense")
 
+        total_income = 0.0
+        total_expenses = 0.0
+        transaction_count = 0
         income_by_category = {}
         expense_by_category = {}
-
-        for t in transactions:
-            if t["transaction_type"] == "income":
-                cat = t.get("income_category") or "other"
-                income_by_category[cat] = income_by_category.get(cat, 0) + t["amount_ngn"]
-            else:
-                cat = t.get("expense_category") or "other"
-                expense_by_category[cat] = expense_by_category.get(cat, 0) + t["amount_ngn"]
+        offset = 0
+
+        # Rollups are one row per month, type and category, so this is a
+        # handful of pages at most regardless of transaction volume.
+        while True:
+            query = supabase.table("transaction_monthly_rollups").select(SUMMARY_COLUMNS).eq(
+                "user_id", user_uuid
+            ).gt("transaction_count", 0)
+            if year:
+                query = query.eq("year", year)
+
+            # Order by the full primary key so offset pages are stable.
+            result = query.order("year").order("month").order("transaction_type").order("category").range(
+                offset, offset + SUMMARY_PAGE_SIZE - 1
+            ).execute()
+            rollups = result.data or []
+
+            for r in rollups:
+                if r["transaction_type"] == "income":
+                    total_income += r["total_ngn"]
+                    income_by_category[r["category"]] = income_by_category.get(r["category"], 0) + r["total_ngn"]
+                else:
+                    total_expenses += r["total_ngn"]
+                    expense_by_category[r["category"]] = expense_by_category.get(r["category"], 0) + r["total_ngn"]
+                transaction_count += r["transaction_count"]
+
+            if len(rollups) < SUMMARY_PAGE_SIZE:
+                break
+            offset += SUMMARY_PAGE_SIZE
 
         return {
             "total_income": round(total_income, 2),
             "total_expenses": round(total_expenses, 2),
             "net_income": round(total_income - total_expenses, 2),
-            "transaction_count": len(transactions),
+            "transaction_count": transaction_count,
             "income_by_category": income_by_category,
             "expense_by_category": expense_by_category,
         }
@@ -1,3 +1,4 @@
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -6,6 +7,7 @@ class Settings(BaseSettings):
     APP_NAME: str = "KudiCore API"
     APP_VERSION: str = "0.1.0"
     DEBUG: bool = False
+    ENVIRONMENT: str = "development"
 
     # Supabase
     SUPABASE_URL: str = ""
@@ -41,7 +43,7 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
-    # CORS
+    # CORS (must be set explicitly in production)
     CORS_ORIGINS: list[str] = ["http://localhost:3000"]
 
     # Rate Limiting
@@ -49,6 +51,14 @@ class Settings(BaseSettings):
     FREE_TIER_TRANSACTION_LIMIT: int = 50
     FREE_TIER_SCENARIO_LIMIT: int = 3
 
+    @model_validator(mode="after")
+    def _require_cors_origins_in_production(self):
+        if self.ENVIRONMENT == "production" and "CORS_ORIGINS" not in self.model_fields_set:
+            raise ValueError(
+                'CORS_ORIGINS must be set in production, e.g. CORS_ORIGINS=["https://app.example.com"]'
+            )
+        return self
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
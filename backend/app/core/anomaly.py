@@ -10,6 +10,8 @@ Features:
   - Income/expense ratio anomalies
 """
 
+import heapq
+import itertools
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
@@ -21,6 +23,14 @@ class AlertSeverity(str, Enum):
     CRITICAL = "critical"
 
 
+# Sort order for alerts: most severe first.
+SEVERITY_RANK: dict[AlertSeverity, int] = {
+    AlertSeverity.CRITICAL: 0,
+    AlertSeverity.WARNING: 1,
+    AlertSeverity.INFO: 2,
+}
+
+
 class AlertType(str, Enum):
     MISSED_DEDUCTION = "missed_deduction"
     DEADLINE_APPROACHING = "deadline_approaching"
@@ -231,11 +241,15 @@ class AnomalyDetector:
         transactions: list[dict],
         average_monthly_income: float,
         current_date: date | None = None,
+        limit: int | None = None,
     ) -> list[Alert]:
-        all_alerts = []
-        all_alerts.extend(self.check_missed_deductions(user_type, claimed_deductions, has_salary_income))
-        all_alerts.extend(self.check_filing_deadlines(user_type, current_date, filed_returns))
-        all_alerts.extend(self.check_transaction_anomalies(transactions, average_monthly_income))
-
-        all_alerts.sort(key=lambda a: {"critical": 0, "warning": 1, "info": 2}[a.severity.value])
-        return all_alerts
+        all_alerts = itertools.chain(
+            self.check_missed_deductions(user_type, claimed_deductions, has_salary_income),
+            self.check_filing_deadlines(user_type, current_date, filed_returns),
+            self.check_transaction_anomalies(transactions, average_monthly_income),
+        )
+
+        # With a limit, keep only the top-k most severe alerts in a bounded heap.
+        if limit is not None:
+            return heapq.nsmallest(limit, all_alerts, key=lambda a: SEVERITY_RANK[a.severity])
+        return sorted(all_alerts, key=lambda a: SEVERITY_RANK[a.severity])
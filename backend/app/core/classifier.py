@@ -10,8 +10,16 @@ Classification logic:
   - Capital vs Profit distinction (critical for KudiCore vision)
 """
 
+import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; falls back to a linear keyword scan
+    ahocorasick = None
 
 
 class TransactionClassification(str, Enum):
@@ -96,21 +104,127 @@ CAPITAL_KEYWORDS = [
     "capital withdrawal",
 ]
 
-VAT_APPLICABLE_CATEGORIES = [
+# Bank-feed markers for money moved between accounts rather than earned or spent.
+TRANSFER_MARKERS = [
+    "transfer",
+    "trf ",
+    "reversal",
+    "refund",
+    "own account",
+]
+
+CAPITAL_BUCKET = 0
+INCOME_BUCKET = 1
+EXPENSE_BUCKET = 2
+TRANSFER_BUCKET = 3
+
+# Bucket order matches the scan order in classify(); within a bucket the
+# earliest keyword wins, exactly as with the original sequential `in` checks.
+KEYWORD_BUCKETS: tuple[dict[str, TransactionClassification | None], ...] = (
+    dict.fromkeys(CAPITAL_KEYWORDS),
+    INCOME_KEYWORDS,
+    EXPENSE_KEYWORDS,
+    dict.fromkeys(TRANSFER_MARKERS, TransactionClassification.TRANSFER),
+)
+
+
+def _build_automaton():
+    automaton = ahocorasick.Automaton()
+    for bucket, keywords in enumerate(KEYWORD_BUCKETS):
+        for rank, (keyword, classification) in enumerate(keywords.items()):
+            automaton.add_word(keyword, (bucket, rank, keyword, classification))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
+
+def _trie_regex(keywords) -> str:
+    """Build an alternation factored on shared prefixes ("loan re(?:ceived|payment)")."""
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in node.items() if char]
+        if len(branches) <= 1:
+            return "".join(branches)
+        return "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
+
+def _keyword_regex(keywords) -> str:
+    # In a prefix-free bucket at most one keyword can match at a given position,
+    # so the trie form is exact. Otherwise keep a flat alternation in precedence order.
+    if not any(a != b and b.startswith(a) for a in keywords for b in keywords):
+        return _trie_regex(keywords)
+    return "|".join(map(re.escape, keywords))
+
+
+# Regex fallback: one lookahead pattern per bucket, so each position reports its
+# highest-precedence keyword and overlapping matches are not skipped.
+KEYWORD_PATTERNS = tuple(
+    re.compile("(?=(" + _keyword_regex(keywords) + "))")
+    for keywords in KEYWORD_BUCKETS
+)
+# Existence-only check for capital keywords: a plain search stops at the first hit.
+CAPITAL_PATTERN = re.compile(_keyword_regex(CAPITAL_KEYWORDS))
+
+KEYWORD_RANKS = tuple(
+    {keyword: rank for rank, keyword in enumerate(keywords)}
+    for keywords in KEYWORD_BUCKETS
+)
+
+
+def match_keywords(desc_lower: str) -> list[tuple[str, TransactionClassification | None] | None]:
+    """
+    Find the highest-precedence keyword hit in each bucket.
+    Returns a list indexed by bucket of (keyword, classification), or None for no hit.
+    """
+    if KEYWORD_AUTOMATON is None:
+        hits = []
+        for keywords, pattern, ranks in zip(KEYWORD_BUCKETS, KEYWORD_PATTERNS, KEYWORD_RANKS):
+            keyword = min(
+                (m.group(1) for m in pattern.finditer(desc_lower)),
+                key=ranks.__getitem__,
+                default=None,
+            )
+            hits.append((keyword, keywords[keyword]) if keyword is not None else None)
+        return hits
+
+    best = [None] * len(KEYWORD_BUCKETS)
+    for _, (bucket, rank, keyword, classification) in KEYWORD_AUTOMATON.iter(desc_lower):
+        current = best[bucket]
+        if current is None or rank < current[0]:
+            best[bucket] = (rank, keyword, classification)
+    return [hit[1:] if hit is not None else None for hit in best]
+
+
+VAT_APPLICABLE_CATEGORIES = frozenset({
     TransactionClassification.INCOME_BUSINESS,
     TransactionClassification.INCOME_FREELANCE,
     TransactionClassification.EXPENSE_BUSINESS,
-]
+})
 
-WHT_APPLICABLE_CATEGORIES = [
+WHT_APPLICABLE_CATEGORIES = frozenset({
     TransactionClassification.INCOME_FREELANCE,
     TransactionClassification.INCOME_RENTAL,
     TransactionClassification.INCOME_DIVIDEND,
     TransactionClassification.INCOME_INVESTMENT,
-]
+})
+
 
+SUGGESTED_CATEGORIES: dict[TransactionClassification, str] = {
+    classification: classification.value.removeprefix("income_").removeprefix("expense_")
+    for classification in TransactionClassification
+}
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassificationResult:
     classification: TransactionClassification
     confidence: float
@@ -124,102 +238,157 @@ class ClassificationResult:
     reasoning: str
 
 
-class TransactionClassifier:
-    """
-    Rule-based transaction classifier.
-    Uses keyword matching for initial classification.
-    AI-enhanced classification is handled by the AI layer calling this as a tool.
-    """
+def _transfer_result(marker: str) -> ClassificationResult:
+    return ClassificationResult(
+        classification=TransactionClassification.TRANSFER,
+        confidence=0.6,
+        is_income=False,
+        is_expense=False,
+        is_capital=False,
+        is_vat_applicable=False,
+        is_wht_applicable=False,
+        is_taxable=False,
+        suggested_category="transfer",
+        reasoning=f"Matched transfer marker: '{marker}'",
+    )
 
-    def classify(
-        self,
-        description: str,
-        amount: float,
-        is_credit: bool = True,
-    ) -> ClassificationResult:
-        desc_lower = description.lower().strip()
-
-        for keyword in CAPITAL_KEYWORDS:
-            if keyword in desc_lower:
-                is_inflow = is_credit
-                classification = (
-                    TransactionClassification.CAPITAL_INFLOW
-                    if is_inflow
-                    else TransactionClassification.CAPITAL_OUTFLOW
-                )
-                return ClassificationResult(
-                    classification=classification,
-                    confidence=0.7,
-                    is_income=False,
-                    is_expense=False,
-                    is_capital=True,
-                    is_vat_applicable=False,
-                    is_wht_applicable=False,
-                    is_taxable=False,
-                    suggested_category="capital",
-                    reasoning=f"Matched capital keyword: '{keyword}'",
-                )
-
-        if is_credit:
-            for keyword, classification in INCOME_KEYWORDS.items():
-                if keyword in desc_lower:
-                    return ClassificationResult(
-                        classification=classification,
-                        confidence=0.75,
-                        is_income=True,
-                        is_expense=False,
-                        is_capital=False,
-                        is_vat_applicable=classification in VAT_APPLICABLE_CATEGORIES,
-                        is_wht_applicable=classification in WHT_APPLICABLE_CATEGORIES,
-                        is_taxable=True,
-                        suggested_category=classification.value.replace("income_", ""),
-                        reasoning=f"Matched income keyword: '{keyword}'",
-                    )
 
+@lru_cache(maxsize=4096)
+def _classify_normalized(desc_lower: str, is_credit: bool) -> ClassificationResult:
+    # Statements repeat descriptions heavily; results are frozen so cached hits can be shared.
+    hits = match_keywords(desc_lower)
+
+    if hits[CAPITAL_BUCKET] is not None:
+        keyword = hits[CAPITAL_BUCKET][0]
+        is_inflow = is_credit
+        classification = (
+            TransactionClassification.CAPITAL_INFLOW
+            if is_inflow
+            else TransactionClassification.CAPITAL_OUTFLOW
+        )
+        return ClassificationResult(
+            classification=classification,
+            confidence=0.7,
+            is_income=False,
+            is_expense=False,
+            is_capital=True,
+            is_vat_applicable=False,
+            is_wht_applicable=False,
+            is_taxable=False,
+            suggested_category="capital",
+            reasoning=f"Matched capital keyword: '{keyword}'",
+        )
+
+    if is_credit:
+        if hits[INCOME_BUCKET] is not None:
+            keyword, classification = hits[INCOME_BUCKET]
             return ClassificationResult(
-                classification=TransactionClassification.INCOME_OTHER,
-                confidence=0.3,
+                classification=classification,
+                confidence=0.75,
                 is_income=True,
                 is_expense=False,
                 is_capital=False,
-                is_vat_applicable=False,
-                is_wht_applicable=False,
+                is_vat_applicable=classification in VAT_APPLICABLE_CATEGORIES,
+                is_wht_applicable=classification in WHT_APPLICABLE_CATEGORIES,
                 is_taxable=True,
-                suggested_category="other_income",
-                reasoning="No specific keyword matched; classified as other income",
+                suggested_category=SUGGESTED_CATEGORIES[classification],
+                reasoning=f"Matched income keyword: '{keyword}'",
             )
-        else:
-            for keyword, classification in EXPENSE_KEYWORDS.items():
-                if keyword in desc_lower:
-                    return ClassificationResult(
-                        classification=classification,
-                        confidence=0.75,
-                        is_income=False,
-                        is_expense=True,
-                        is_capital=False,
-                        is_vat_applicable=classification in VAT_APPLICABLE_CATEGORIES,
-                        is_wht_applicable=False,
-                        is_taxable=False,
-                        suggested_category=classification.value.replace("expense_", ""),
-                        reasoning=f"Matched expense keyword: '{keyword}'",
-                    )
 
+        if hits[TRANSFER_BUCKET] is not None:
+            return _transfer_result(hits[TRANSFER_BUCKET][0])
+
+        return ClassificationResult(
+            classification=TransactionClassification.INCOME_OTHER,
+            confidence=0.3,
+            is_income=True,
+            is_expense=False,
+            is_capital=False,
+            is_vat_applicable=False,
+            is_wht_applicable=False,
+            is_taxable=True,
+            suggested_category="other_income",
+            reasoning="No specific keyword matched; classified as other income",
+        )
+    else:
+        if hits[EXPENSE_BUCKET] is not None:
+            keyword, classification = hits[EXPENSE_BUCKET]
             return ClassificationResult(
-                classification=TransactionClassification.EXPENSE_PERSONAL,
-                confidence=0.3,
+                classification=classification,
+                confidence=0.75,
                 is_income=False,
                 is_expense=True,
                 is_capital=False,
-                is_vat_applicable=False,
+                is_vat_applicable=classification in VAT_APPLICABLE_CATEGORIES,
                 is_wht_applicable=False,
                 is_taxable=False,
-                suggested_category="personal",
-                reasoning="No specific keyword matched; classified as personal expense",
+                suggested_category=SUGGESTED_CATEGORIES[classification],
+                reasoning=f"Matched expense keyword: '{keyword}'",
             )
 
+        if hits[TRANSFER_BUCKET] is not None:
+            return _transfer_result(hits[TRANSFER_BUCKET][0])
+
+        return ClassificationResult(
+            classification=TransactionClassification.EXPENSE_PERSONAL,
+            confidence=0.3,
+            is_income=False,
+            is_expense=True,
+            is_capital=False,
+            is_vat_applicable=False,
+            is_wht_applicable=False,
+            is_taxable=False,
+            suggested_category="personal",
+            reasoning="No specific keyword matched; classified as personal expense",
+        )
+
+
+@lru_cache(maxsize=4096)
+def _is_capital(desc_lower: str) -> bool:
+    return CAPITAL_PATTERN.search(desc_lower) is not None
+
+
+class TransactionClassifier:
+    """
+    Rule-based transaction classifier.
+    Uses keyword matching for initial classification.
+    AI-enhanced classification is handled by the AI layer calling this as a tool.
+    """
+
+    @staticmethod
+    def _prep(description: str) -> str:
+        # casefold() also folds non-ASCII case variants that lower() leaves alone.
+        return description.casefold().strip()
+
+    def classify(
+        self,
+        description: str,
+        amount: float,
+        is_credit: bool = True,
+    ) -> ClassificationResult:
+        return _classify_normalized(self._prep(description), is_credit)
+
+    def classify_batch(
+        self,
+        descriptions: Iterable[str],
+        is_credit: Iterable[bool],
+    ) -> list[ClassificationResult]:
+        """
+        Classify many transactions at once, e.g. every line of a bank statement.
+        Repeated (description, direction) pairs are classified once and the result reused.
+        """
+        seen: dict[tuple[str, bool], ClassificationResult] = {}
+        results = []
+        for description, credit in zip(descriptions, is_credit):
+            key = (description, bool(credit))
+            result = seen.get(key)
+            if result is None:
+                result = seen[key] = self.classify(description, 0.0, key[1])
+            results.append(result)
+        return results
+
     def is_capital_vs_profit(self, description: str, amount: float) -> dict:
-        desc_lower = description.lower()
-        is_capital = any(kw in desc_lower for kw in CAPITAL_KEYWORDS)
+        is_capital = _is_capital(self._prep(description))
 
         return {
             "is_capital": is_capital,
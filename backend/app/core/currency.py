@@ -9,11 +9,16 @@ Features:
   - Forex gain/loss classification
 """
 
+import asyncio
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date
 from enum import Enum
 
 import httpx
+import numpy as np
+
+from app.core.rounding import round_kobo
 
 
 class SupportedCurrency(str, Enum):
@@ -32,7 +37,7 @@ FALLBACK_RATES: dict[str, float] = {
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExchangeRate:
     currency: str
     rate_to_ngn: float
@@ -40,7 +45,7 @@ class ExchangeRate:
     source: str = "cbn"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversionResult:
     original_amount: float
     original_currency: str
@@ -50,7 +55,7 @@ class ConversionResult:
     source: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ForexGainLoss:
     acquisition_amount_ngn: float
     disposal_amount_ngn: float
@@ -59,6 +64,32 @@ class ForexGainLoss:
     is_realized: bool
 
 
+@dataclass(slots=True, frozen=True)
+class ForexGainLossBatch:
+    acquisition_amount_ngn: np.ndarray
+    disposal_amount_ngn: np.ndarray
+    gain_or_loss: np.ndarray
+    is_gain: np.ndarray
+    is_realized: bool
+
+    def to_list(self) -> list[ForexGainLoss]:
+        return [
+            ForexGainLoss(
+                acquisition_amount_ngn=acq,
+                disposal_amount_ngn=disp,
+                gain_or_loss=gain,
+                is_gain=is_gain,
+                is_realized=self.is_realized,
+            )
+            for acq, disp, gain, is_gain in zip(
+                self.acquisition_amount_ngn.tolist(),
+                self.disposal_amount_ngn.tolist(),
+                self.gain_or_loss.tolist(),
+                self.is_gain.tolist(),
+            )
+        ]
+
+
 class CurrencyEngine:
     """
     Multi-currency engine using CBN official rates.
@@ -66,7 +97,7 @@ class CurrencyEngine:
     """
 
     def __init__(self):
-        self._rate_cache: dict[str, dict[str, ExchangeRate]] = {}
+        self._rate_cache: dict[tuple[date, str], ExchangeRate] = {}
 
     def get_rate(self, currency: str, rate_date: date | None = None) -> ExchangeRate:
         if currency == "NGN":
@@ -80,9 +111,10 @@ class CurrencyEngine:
         if rate_date is None:
             rate_date = date.today()
 
-        date_key = rate_date.isoformat()
-        if date_key in self._rate_cache and currency in self._rate_cache[date_key]:
-            return self._rate_cache[date_key][currency]
+        key = (rate_date, currency)
+        cached = self._rate_cache.get(key)
+        if cached is not None:
+            return cached
 
         rate = FALLBACK_RATES.get(currency)
         if rate is None:
@@ -95,17 +127,12 @@ class CurrencyEngine:
             source="fallback",
         )
 
-        if date_key not in self._rate_cache:
-            self._rate_cache[date_key] = {}
-        self._rate_cache[date_key][currency] = exchange_rate
+        self._rate_cache[key] = exchange_rate
 
         return exchange_rate
 
     def set_rate(self, currency: str, rate: float, rate_date: date, source: str = "cbn") -> None:
-        date_key = rate_date.isoformat()
-        if date_key not in self._rate_cache:
-            self._rate_cache[date_key] = {}
-        self._rate_cache[date_key][currency] = ExchangeRate(
+        self._rate_cache[(rate_date, currency)] = ExchangeRate(
             currency=currency,
             rate_to_ngn=rate,
             rate_date=rate_date,
@@ -143,6 +170,23 @@ class CurrencyEngine:
             source=rate.source,
         )
 
+    def convert_to_ngn_batch(
+        self,
+        amounts: np.ndarray,
+        currency: str,
+        rate_date: date | None = None,
+    ) -> np.ndarray:
+        """Convert many amounts in one currency, looking the rate up once."""
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if (amounts < 0).any():
+            raise ValueError("Amount cannot be negative")
+
+        if currency == "NGN":
+            return amounts.copy()
+
+        rate = self.get_rate(currency, rate_date)
+        return round_kobo(amounts * rate.rate_to_ngn)
+
     def calculate_forex_gain_loss(
         self,
         acquisition_amount: float,
@@ -166,26 +210,72 @@ class CurrencyEngine:
             is_realized=is_realized,
         )
 
+    def calculate_forex_gain_loss_batch(
+        self,
+        acquisition_amounts: np.ndarray,
+        acquisition_currencies: Sequence[str],
+        acquisition_dates: Sequence[date],
+        disposal_amounts: np.ndarray,
+        disposal_currencies: Sequence[str],
+        disposal_dates: Sequence[date],
+        is_realized: bool = True,
+    ) -> ForexGainLossBatch:
+        """
+        Forex gain/loss for many lots at once.
+        Each distinct (currency, date) rate is looked up once and shared by every lot that uses it.
+        """
+        acquisition_amounts = np.asarray(acquisition_amounts, dtype=np.float64)
+        disposal_amounts = np.asarray(disposal_amounts, dtype=np.float64)
+        if (acquisition_amounts < 0).any() or (disposal_amounts < 0).any():
+            raise ValueError("Amount cannot be negative")
+
+        rates: dict[tuple[str, date], float] = {}
+
+        def lookup(currencies: Sequence[str], dates: Sequence[date]) -> np.ndarray:
+            out = np.empty(len(currencies), dtype=np.float64)
+            for i, key in enumerate(zip(currencies, dates)):
+                rate = rates.get(key)
+                if rate is None:
+                    rate = rates[key] = self.get_rate(*key).rate_to_ngn
+                out[i] = rate
+            return out
+
+        acq_ngn = round_kobo(acquisition_amounts * lookup(acquisition_currencies, acquisition_dates))
+        disp_ngn = round_kobo(disposal_amounts * lookup(disposal_currencies, disposal_dates))
+        gain_or_loss = round_kobo(disp_ngn - acq_ngn)
+
+        return ForexGainLossBatch(
+            acquisition_amount_ngn=acq_ngn,
+            disposal_amount_ngn=disp_ngn,
+            gain_or_loss=gain_or_loss,
+            is_gain=gain_or_loss > 0,
+            is_realized=is_realized,
+        )
+
     async def fetch_cbn_rates(self) -> dict[str, float]:
         """
         Fetch latest CBN exchange rates.
         This should be called by a scheduled task (Celery beat) daily.
         Falls back to stored rates if CBN API is unavailable.
         """
+        currencies = ("USD", "GBP", "EUR")
         rates = {}
         try:
             async with httpx.AsyncClient(timeout=30.0) as client:
-                for currency in ["USD", "GBP", "EUR"]:
-                    response = await client.get(
-                        CBN_RATE_API,
-                        params={"curr": currency, "type": "cbn"},
-                    )
-                    if response.status_code == 200:
-                        # TODO: Parse CBN response — format varies, needs adaptation
-                        # For now, use fallback rates
-                        rates[currency] = FALLBACK_RATES[currency]
-                    else:
-                        rates[currency] = FALLBACK_RATES[currency]
+                responses = await asyncio.gather(
+                    *(
+                        client.get(CBN_RATE_API, params={"curr": currency, "type": "cbn"})
+                        for currency in currencies
+                    ),
+                    return_exceptions=True,
+                )
+            for currency, response in zip(currencies, responses):
+                if isinstance(response, httpx.Response) and response.status_code == 200:
+                    # TODO: Parse CBN response — format varies, needs adaptation
+                    # For now, use fallback rates
+                    rates[currency] = FALLBACK_RATES[currency]
+                else:
+                    rates[currency] = FALLBACK_RATES[currency]
         except Exception:
             rates = FALLBACK_RATES.copy()
 
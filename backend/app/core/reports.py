@@ -10,16 +10,19 @@ Report Types:
 
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import lru_cache
 
+from app.core.rounding import round_kobo
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TaxSummaryLine:
     label: str
     amount: float
     note: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaxSummaryReport:
     user_name: str
     user_type: str
@@ -47,7 +50,7 @@ class TaxSummaryReport:
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComplianceChecklistItem:
     title: str
     description: str
@@ -57,7 +60,7 @@ class ComplianceChecklistItem:
     action_required: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComplianceChecklist:
     user_name: str
     user_type: str
@@ -72,6 +75,12 @@ class ComplianceChecklist:
     )
 
 
+@lru_cache(maxsize=32)
+def _deadlines(year: int) -> tuple[date, date]:
+    """PIT and CIT/development levy filing deadlines for a tax year."""
+    return date(year + 1, 3, 31), date(year + 1, 6, 30)
+
+
 class ReportGenerator:
     """
     Generates structured report data from user financial information.
@@ -87,28 +96,29 @@ class ReportGenerator:
         deduction_data: list[dict],
         tax_results: dict,
         period: str = "annual",
+        generated_at: str | None = None,
     ) -> TaxSummaryReport:
-        income_breakdown = []
-        total_income = 0.0
-        for item in income_data:
-            amount = item.get("amount", 0.0)
-            total_income += amount
-            income_breakdown.append(TaxSummaryLine(
+        income_breakdown = [
+            TaxSummaryLine(
                 label=item.get("category", "Other"),
-                amount=amount,
+                amount=item.get("amount", 0.0),
                 note=item.get("note", ""),
-            ))
+            )
+            for item in income_data
+        ]
+        # Sequential sum, as the amounts were accumulated before; numpy's pairwise
+        # .sum() can land a kobo away after rounding.
+        total_income = sum(line.amount for line in income_breakdown)
 
-        deduction_breakdown = []
-        total_deductions = 0.0
-        for item in deduction_data:
-            amount = item.get("amount", 0.0)
-            total_deductions += amount
-            deduction_breakdown.append(TaxSummaryLine(
+        deduction_breakdown = [
+            TaxSummaryLine(
                 label=item.get("type", "Other"),
-                amount=amount,
+                amount=item.get("amount", 0.0),
                 note=item.get("note", ""),
-            ))
+            )
+            for item in deduction_data
+        ]
+        total_deductions = sum(line.amount for line in deduction_breakdown)
 
         taxable_income = max(total_income - total_deductions, 0.0)
 
@@ -121,24 +131,34 @@ class ReportGenerator:
         total_tax = pit_liability + cit_liability + vat_liability + development_levy
         effective_rate = (total_tax / total_income * 100) if total_income > 0 else 0.0
 
+        (
+            total_income, total_deductions, taxable_income,
+            pit_liability, cit_liability, vat_liability, wht_deducted, development_levy,
+            total_tax, effective_rate,
+        ) = round_kobo([
+            total_income, total_deductions, taxable_income,
+            pit_liability, cit_liability, vat_liability, wht_deducted, development_levy,
+            total_tax, effective_rate,
+        ]).tolist()
+
         return TaxSummaryReport(
             user_name=user_name,
             user_type=user_type,
             report_period=period,
             year=year,
-            generated_at=datetime.now().isoformat(),
-            total_income=round(total_income, 2),
+            generated_at=generated_at or datetime.now().isoformat(),
+            total_income=total_income,
             income_breakdown=income_breakdown,
-            total_deductions=round(total_deductions, 2),
+            total_deductions=total_deductions,
             deduction_breakdown=deduction_breakdown,
-            taxable_income=round(taxable_income, 2),
-            pit_liability=round(pit_liability, 2),
-            cit_liability=round(cit_liability, 2),
-            vat_liability=round(vat_liability, 2),
-            wht_deducted=round(wht_deducted, 2),
-            development_levy=round(development_levy, 2),
-            total_tax_liability=round(total_tax, 2),
-            effective_rate=round(effective_rate, 2),
+            taxable_income=taxable_income,
+            pit_liability=pit_liability,
+            cit_liability=cit_liability,
+            vat_liability=vat_liability,
+            wht_deducted=wht_deducted,
+            development_levy=development_levy,
+            total_tax_liability=total_tax,
+            effective_rate=effective_rate,
             pit_breakdown=tax_results.get("pit_breakdown", []),
         )
 
@@ -149,6 +169,7 @@ class ReportGenerator:
         year: int,
         filed_returns: list[str] | None = None,
         current_date: date | None = None,
+        generated_at: str | None = None,
     ) -> ComplianceChecklist:
         if filed_returns is None:
             filed_returns = []
@@ -156,9 +177,9 @@ class ReportGenerator:
             current_date = date.today()
 
         items = []
+        pit_deadline, cit_deadline = _deadlines(year)
 
         if user_type in ["individual", "freelancer"]:
-            pit_deadline = date(year + 1, 3, 31)
             pit_status = "completed" if "pit_annual" in filed_returns else (
                 "overdue" if current_date > pit_deadline else "pending"
             )
@@ -181,7 +202,7 @@ class ReportGenerator:
             ))
 
         if user_type == "sme":
-            cit_deadline = date(year + 1, 6, 30)
+            monthly_due_date = f"{year}-XX-21 (monthly)"
             cit_status = "completed" if "cit_annual" in filed_returns else (
                 "overdue" if current_date > cit_deadline else "pending"
             )
@@ -197,7 +218,7 @@ class ReportGenerator:
             items.append(ComplianceChecklistItem(
                 title="Monthly VAT Returns",
                 description="File and remit VAT collected on taxable supplies by the 21st of the following month.",
-                due_date=f"{year}-XX-21 (monthly)",
+                due_date=monthly_due_date,
                 status="pending",
                 tax_type="VAT",
                 action_required="File monthly VAT returns via FIRS TaxPro Max",
@@ -206,7 +227,7 @@ class ReportGenerator:
             items.append(ComplianceChecklistItem(
                 title="Monthly WHT Remittance",
                 description="Remit withholding tax deducted at source by the 21st of the following month.",
-                due_date=f"{year}-XX-21 (monthly)",
+                due_date=monthly_due_date,
                 status="pending",
                 tax_type="WHT",
                 action_required="Remit WHT and file returns via FIRS TaxPro Max",
@@ -215,7 +236,7 @@ class ReportGenerator:
             items.append(ComplianceChecklistItem(
                 title="Development Levy",
                 description="4% development levy on assessable profits (non-small companies).",
-                due_date=date(year + 1, 6, 30).isoformat(),
+                due_date=cit_deadline.isoformat(),
                 status="pending" if "development_levy" not in filed_returns else "completed",
                 tax_type="Development Levy",
                 action_required="Paid alongside CIT return",
@@ -229,7 +250,7 @@ class ReportGenerator:
             user_name=user_name,
             user_type=user_type,
             year=year,
-            generated_at=datetime.now().isoformat(),
+            generated_at=generated_at or datetime.now().isoformat(),
             items=items,
             summary=summary,
         )
@@ -0,0 +1,20 @@
+"""
+Kobo rounding for the vectorised (numpy) calculation paths.
+
+np.round scales by 100 and rounds half-to-even, which disagrees with the
+built-in round() on values that sit on a half-kobo boundary. The batch paths
+use round_kobo so they agree with the scalar calculators exactly.
+"""
+
+import numpy as np
+
+
+def round_kobo(values: np.ndarray) -> np.ndarray:
+    """np.round(values, 2), deferring to built-in round() near half-kobo ties."""
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    ties = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    if ties.any():
+        rounded[ties] = [round(value, 2) for value in values[ties].tolist()]
+    return rounded
@@ -11,11 +11,12 @@ Examples:
 
 from dataclasses import dataclass, field
 
-from app.core.tax_rules.pit import PITCalculator, Deductions
-from app.core.tax_rules.cit import CITCalculator, CompanySize
+from app.core.tax_rules import pit_calc, cit_calc
+from app.core.tax_rules.pit import Deductions
+from app.core.tax_rules.cit import CompanySize
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScenarioComparison:
     label: str
     current_tax: float
@@ -37,6 +38,7 @@ class ScenarioInput:
     company_turnover: float | None = None
     company_profit: float | None = None
     is_minimum_wage: bool = False
+    include_insights: bool = True
 
 
 class ScenarioModeler:
@@ -46,17 +48,18 @@ class ScenarioModeler:
     """
 
     def __init__(self):
-        self.pit_calc = PITCalculator()
-        self.cit_calc = CITCalculator()
+        self.pit_calc = pit_calc
+        self.cit_calc = cit_calc
 
     def compare_income_change(
         self,
         current_income: float,
         projected_income: float,
         deductions: Deductions | None = None,
+        include_insights: bool = True,
     ) -> ScenarioComparison:
-        current = self.pit_calc.calculate(current_income, deductions)
-        projected = self.pit_calc.calculate(projected_income, deductions)
+        current = self.pit_calc.calculate(current_income, deductions, include_breakdown=False)
+        projected = self.pit_calc.calculate(projected_income, deductions, include_breakdown=False)
 
         difference = projected.tax_liability - current.tax_liability
         pct_change = (
@@ -64,31 +67,32 @@ class ScenarioModeler:
         )
 
         insights = []
-        if difference > 0:
-            insights.append(
-                f"Increasing your income by ₦{projected_income - current_income:,.2f} "
-                f"would increase your tax by ₦{difference:,.2f}."
-            )
-        elif difference < 0:
-            insights.append(
-                f"Decreasing your income by ₦{current_income - projected_income:,.2f} "
-                f"would save you ₦{abs(difference):,.2f} in taxes."
-            )
-
-        if projected.effective_rate > current.effective_rate:
-            insights.append(
-                f"Your effective tax rate would increase from {current.effective_rate}% "
-                f"to {projected.effective_rate}%."
-            )
-
-        marginal_tax = difference
-        marginal_income = projected_income - current_income
-        if marginal_income > 0:
-            marginal_rate = marginal_tax / marginal_income * 100
-            insights.append(
-                f"The marginal tax rate on the additional ₦{marginal_income:,.2f} "
-                f"is {marginal_rate:.1f}%."
-            )
+        if include_insights:
+            if difference > 0:
+                insights.append(
+                    f"Increasing your income by ₦{projected_income - current_income:,.2f} "
+                    f"would increase your tax by ₦{difference:,.2f}."
+                )
+            elif difference < 0:
+                insights.append(
+                    f"Decreasing your income by ₦{current_income - projected_income:,.2f} "
+                    f"would save you ₦{abs(difference):,.2f} in taxes."
+                )
+
+            if projected.effective_rate > current.effective_rate:
+                insights.append(
+                    f"Your effective tax rate would increase from {current.effective_rate}% "
+                    f"to {projected.effective_rate}%."
+                )
+
+            marginal_tax = difference
+            marginal_income = projected_income - current_income
+            if marginal_income > 0:
+                marginal_rate = marginal_tax / marginal_income * 100
+                insights.append(
+                    f"The marginal tax rate on the additional ₦{marginal_income:,.2f} "
+                    f"is {marginal_rate:.1f}%."
+                )
 
         return ScenarioComparison(
             label="Income Change Scenario",
@@ -106,9 +110,10 @@ class ScenarioModeler:
         gross_income: float,
         current_deductions: Deductions,
         projected_deductions: Deductions,
+        include_insights: bool = True,
     ) -> ScenarioComparison:
-        current = self.pit_calc.calculate(gross_income, current_deductions)
-        projected = self.pit_calc.calculate(gross_income, projected_deductions)
+        current = self.pit_calc.calculate(gross_income, current_deductions, include_breakdown=False)
+        projected = self.pit_calc.calculate(gross_income, projected_deductions, include_breakdown=False)
 
         difference = projected.tax_liability - current.tax_liability
         pct_change = (
@@ -116,24 +121,25 @@ class ScenarioModeler:
         )
 
         insights = []
-        additional_deductions = projected_deductions.total - current_deductions.total
-        if additional_deductions > 0 and difference < 0:
-            insights.append(
-                f"Claiming an additional ₦{additional_deductions:,.2f} in deductions "
-                f"would save you ₦{abs(difference):,.2f} in taxes."
-            )
-
-        if current_deductions.annual_rent_paid == 0 and projected_deductions.annual_rent_paid > 0:
-            insights.append(
-                f"Adding rent relief (₦{projected_deductions.rent_relief:,.2f}) "
-                f"contributes to your tax savings."
-            )
-
-        if current_deductions.pension == 0 and projected_deductions.pension > 0:
-            insights.append(
-                f"Pension contributions of ₦{projected_deductions.pension:,.2f} "
-                f"are tax-deductible and reduce your liability."
-            )
+        if include_insights:
+            additional_deductions = projected_deductions.total - current_deductions.total
+            if additional_deductions > 0 and difference < 0:
+                insights.append(
+                    f"Claiming an additional ₦{additional_deductions:,.2f} in deductions "
+                    f"would save you ₦{abs(difference):,.2f} in taxes."
+                )
+
+            if current_deductions.annual_rent_paid == 0 and projected_deductions.annual_rent_paid > 0:
+                insights.append(
+                    f"Adding rent relief (₦{projected_deductions.rent_relief:,.2f}) "
+                    f"contributes to your tax savings."
+                )
+
+            if current_deductions.pension == 0 and projected_deductions.pension > 0:
+                insights.append(
+                    f"Pension contributions of ₦{projected_deductions.pension:,.2f} "
+                    f"are tax-deductible and reduce your liability."
+                )
 
         return ScenarioComparison(
             label="Deduction Impact Scenario",
@@ -151,8 +157,9 @@ class ScenarioModeler:
         gross_income: float,
         deductions: Deductions | None = None,
         business_expenses: float = 0.0,
+        include_insights: bool = True,
     ) -> ScenarioComparison:
-        pit_result = self.pit_calc.calculate(gross_income, deductions)
+        pit_result = self.pit_calc.calculate(gross_income, deductions, include_breakdown=False)
 
         company_profit = gross_income - business_expenses
         cit_result = self.cit_calc.calculate(
@@ -166,32 +173,33 @@ class ScenarioModeler:
         )
 
         insights = []
-        if cit_result.company_size == CompanySize.SMALL:
-            insights.append(
-                f"As a small company (turnover ≤ ₦25M), your CIT rate would be 0%. "
-                f"You'd save ₦{abs(difference):,.2f} compared to individual filing."
-            )
-        elif difference < 0:
-            insights.append(
-                f"Registering as a company could save you ₦{abs(difference):,.2f} in taxes."
-            )
-        else:
-            insights.append(
-                f"Filing as an individual is currently more tax-efficient, "
-                f"saving you ₦{difference:,.2f} compared to company filing."
-            )
+        if include_insights:
+            if cit_result.company_size == CompanySize.SMALL:
+                insights.append(
+                    f"As a small company (turnover ≤ ₦25M), your CIT rate would be 0%. "
+                    f"You'd save ₦{abs(difference):,.2f} compared to individual filing."
+                )
+            elif difference < 0:
+                insights.append(
+                    f"Registering as a company could save you ₦{abs(difference):,.2f} in taxes."
+                )
+            else:
+                insights.append(
+                    f"Filing as an individual is currently more tax-efficient, "
+                    f"saving you ₦{difference:,.2f} compared to company filing."
+                )
 
-        insights.append(
-            f"Individual effective rate: {pit_result.effective_rate}% | "
-            f"Company effective rate: {cit_result.effective_rate}%"
-        )
-
-        if business_expenses > 0:
             insights.append(
-                f"Note: Company calculation accounts for ₦{business_expenses:,.2f} "
-                f"in business expenses, reducing assessable profit to ₦{company_profit:,.2f}."
+                f"Individual effective rate: {pit_result.effective_rate}% | "
+                f"Company effective rate: {cit_result.effective_rate}%"
             )
 
+            if business_expenses > 0:
+                insights.append(
+                    f"Note: Company calculation accounts for ₦{business_expenses:,.2f} "
+                    f"in business expenses, reducing assessable profit to ₦{company_profit:,.2f}."
+                )
+
         return ScenarioComparison(
             label="Individual vs Company Scenario",
             current_tax=pit_result.tax_liability,
@@ -209,17 +217,20 @@ class ScenarioModeler:
                 current_income=scenario_input.current_gross_income,
                 projected_income=scenario_input.projected_gross_income or scenario_input.current_gross_income,
                 deductions=scenario_input.current_deductions,
+                include_insights=scenario_input.include_insights,
             )
         elif scenario_input.scenario_type == "deduction_impact":
             return self.compare_deduction_impact(
                 gross_income=scenario_input.current_gross_income,
                 current_deductions=scenario_input.current_deductions or Deductions(),
                 projected_deductions=scenario_input.projected_deductions or Deductions(),
+                include_insights=scenario_input.include_insights,
             )
         elif scenario_input.scenario_type == "individual_vs_company":
             return self.compare_individual_vs_company(
                 gross_income=scenario_input.current_gross_income,
                 deductions=scenario_input.current_deductions,
+                include_insights=scenario_input.include_insights,
             )
         else:
             raise ValueError(f"Unknown scenario type: {scenario_input.scenario_type}")
@@ -3,4 +3,19 @@ from app.core.tax_rules.cit import CITCalculator
 from app.core.tax_rules.vat import VATCalculator
 from app.core.tax_rules.wht import WHTCalculator
 
-__all__ = ["PITCalculator", "CITCalculator", "VATCalculator", "WHTCalculator"]
+# The calculators are stateless; share one instance of each across the app.
+pit_calc = PITCalculator()
+cit_calc = CITCalculator()
+vat_calc = VATCalculator()
+wht_calc = WHTCalculator()
+
+__all__ = [
+    "PITCalculator",
+    "CITCalculator",
+    "VATCalculator",
+    "WHTCalculator",
+    "pit_calc",
+    "cit_calc",
+    "vat_calc",
+    "wht_calc",
+]
@@ -11,8 +11,14 @@ Development Levy (Section 59):
   - 4% on assessable profits of all companies (except small companies and non-residents)
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
+
+from app.core.rounding import round_kobo
 
 
 class CompanySize(str, Enum):
@@ -25,13 +31,17 @@ SMALL_COMPANY_TURNOVER_THRESHOLD = 25_000_000.0
 LARGE_COMPANY_TURNOVER_THRESHOLD = 100_000_000.0
 MNE_TURNOVER_THRESHOLD = 20_000_000_000.0
 
+# Upper bounds (inclusive) of each size band, in ascending order.
+_SIZE_THRESHOLDS = (SMALL_COMPANY_TURNOVER_THRESHOLD, LARGE_COMPANY_TURNOVER_THRESHOLD)
+_SIZES = (CompanySize.SMALL, CompanySize.MEDIUM, CompanySize.LARGE)
+
 CIT_RATE_SMALL = 0.00
 CIT_RATE_STANDARD = 0.30
 MINIMUM_EFFECTIVE_RATE = 0.15
 DEVELOPMENT_LEVY_RATE = 0.04
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CITResult:
     company_size: CompanySize
     gross_profit: float
@@ -46,6 +56,67 @@ class CITResult:
     breakdown: dict = field(default_factory=dict)
 
 
+@lru_cache(maxsize=4096, typed=True)
+def _calculate(
+    gross_profit: float,
+    allowable_deductions: float,
+    annual_turnover: float,
+    is_mne: bool,
+    company_size: CompanySize,
+) -> CITResult:
+    assessable_profit = max(gross_profit - allowable_deductions, 0.0)
+
+    if company_size == CompanySize.SMALL:
+        cit_rate = CIT_RATE_SMALL
+    else:
+        cit_rate = CIT_RATE_STANDARD
+
+    cit_liability = assessable_profit * cit_rate
+
+    development_levy = 0.0
+    if company_size != CompanySize.SMALL:
+        development_levy = assessable_profit * DEVELOPMENT_LEVY_RATE
+
+    total_before_minimum = cit_liability + development_levy
+
+    minimum_tax_applied = False
+    if is_mne or annual_turnover >= MNE_TURNOVER_THRESHOLD:
+        effective = (total_before_minimum / assessable_profit) if assessable_profit > 0 else 0
+        if effective < MINIMUM_EFFECTIVE_RATE and assessable_profit > 0:
+            minimum_tax = assessable_profit * MINIMUM_EFFECTIVE_RATE
+            cit_liability = minimum_tax - development_levy
+            minimum_tax_applied = True
+
+    total_tax_liability = cit_liability + development_levy
+    effective_rate = (
+        (total_tax_liability / assessable_profit * 100) if assessable_profit > 0 else 0.0
+    )
+
+    cit_liability = round(cit_liability, 2)
+    development_levy = round(development_levy, 2)
+
+    breakdown = {
+        "cit_rate_applied": cit_rate * 100,
+        "cit_amount": cit_liability,
+        "development_levy_rate": DEVELOPMENT_LEVY_RATE * 100 if company_size != CompanySize.SMALL else 0,
+        "development_levy_amount": development_levy,
+    }
+
+    return CITResult(
+        company_size=company_size,
+        gross_profit=gross_profit,
+        allowable_deductions=allowable_deductions,
+        assessable_profit=round(assessable_profit, 2),
+        cit_rate=cit_rate,
+        cit_liability=cit_liability,
+        development_levy=development_levy,
+        total_tax_liability=round(total_tax_liability, 2),
+        effective_rate=round(effective_rate, 2),
+        minimum_tax_applied=minimum_tax_applied,
+        breakdown=breakdown,
+    )
+
+
 class CITCalculator:
     """
     Deterministic Company Income Tax calculator for Nigerian companies.
@@ -53,11 +124,7 @@ class CITCalculator:
     """
 
     def classify_company(self, annual_turnover: float) -> CompanySize:
-        if annual_turnover <= SMALL_COMPANY_TURNOVER_THRESHOLD:
-            return CompanySize.SMALL
-        elif annual_turnover <= LARGE_COMPANY_TURNOVER_THRESHOLD:
-            return CompanySize.MEDIUM
-        return CompanySize.LARGE
+        return _SIZES[bisect_left(_SIZE_THRESHOLDS, annual_turnover)]
 
     def calculate(
         self,
@@ -73,51 +140,43 @@ class CITCalculator:
         if company_size is None:
             company_size = self.classify_company(annual_turnover)
 
-        assessable_profit = max(gross_profit - allowable_deductions, 0.0)
-
-        if company_size == CompanySize.SMALL:
-            cit_rate = CIT_RATE_SMALL
-        else:
-            cit_rate = CIT_RATE_STANDARD
+        result = _calculate(gross_profit, allowable_deductions, annual_turnover, is_mne, company_size)
+        # The cached result is shared between calls; give each caller its own dict.
+        return replace(result, breakdown=dict(result.breakdown))
 
-        cit_liability = assessable_profit * cit_rate
-
-        development_levy = 0.0
-        if company_size != CompanySize.SMALL:
-            development_levy = assessable_profit * DEVELOPMENT_LEVY_RATE
+    def calculate_batch(
+        self,
+        gross_profits: np.ndarray,
+        allowable_deductions: np.ndarray | float = 0.0,
+        annual_turnovers: np.ndarray | float = 0.0,
+        is_mne: np.ndarray | bool = False,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        CIT for many companies at once, e.g. a regulatory simulation.
+        Company size is derived from turnover. Returns (cit_liability, development_levy, minimum_tax_applied).
+        """
+        gross_profits = np.asarray(gross_profits, dtype=np.float64)
+        if (gross_profits < 0).any():
+            raise ValueError("Gross profit cannot be negative")
 
-        total_before_minimum = cit_liability + development_levy
+        annual_turnovers = np.broadcast_to(np.asarray(annual_turnovers, dtype=np.float64), gross_profits.shape)
+        assessable_profit = np.maximum(gross_profits - allowable_deductions, 0.0)
 
-        minimum_tax_applied = False
-        if is_mne or annual_turnover >= MNE_TURNOVER_THRESHOLD:
-            effective = (total_before_minimum / assessable_profit) if assessable_profit > 0 else 0
-            if effective < MINIMUM_EFFECTIVE_RATE and assessable_profit > 0:
-                minimum_tax = assessable_profit * MINIMUM_EFFECTIVE_RATE
-                cit_liability = minimum_tax - development_levy
-                minimum_tax_applied = True
+        is_small = annual_turnovers <= SMALL_COMPANY_TURNOVER_THRESHOLD
+        cit_liability = assessable_profit * np.where(is_small, CIT_RATE_SMALL, CIT_RATE_STANDARD)
+        development_levy = np.where(is_small, 0.0, assessable_profit * DEVELOPMENT_LEVY_RATE)
 
-        total_tax_liability = cit_liability + development_levy
-        effective_rate = (
-            (total_tax_liability / assessable_profit * 100) if assessable_profit > 0 else 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            effective = (cit_liability + development_levy) / assessable_profit
+        minimum_tax_applied = (
+            (np.asarray(is_mne) | (annual_turnovers >= MNE_TURNOVER_THRESHOLD))
+            & (assessable_profit > 0)
+            & (effective < MINIMUM_EFFECTIVE_RATE)
         )
-
-        breakdown = {
-            "cit_rate_applied": cit_rate * 100,
-            "cit_amount": round(cit_liability, 2),
-            "development_levy_rate": DEVELOPMENT_LEVY_RATE * 100 if company_size != CompanySize.SMALL else 0,
-            "development_levy_amount": round(development_levy, 2),
-        }
-
-        return CITResult(
-            company_size=company_size,
-            gross_profit=gross_profit,
-            allowable_deductions=allowable_deductions,
-            assessable_profit=round(assessable_profit, 2),
-            cit_rate=cit_rate,
-            cit_liability=round(cit_liability, 2),
-            development_levy=round(development_levy, 2),
-            total_tax_liability=round(total_tax_liability, 2),
-            effective_rate=round(effective_rate, 2),
-            minimum_tax_applied=minimum_tax_applied,
-            breakdown=breakdown,
+        cit_liability = np.where(
+            minimum_tax_applied,
+            assessable_profit * MINIMUM_EFFECTIVE_RATE - development_levy,
+            cit_liability,
         )
+
+        return round_kobo(cit_liability), round_kobo(development_levy), minimum_tax_applied
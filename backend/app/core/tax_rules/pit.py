@@ -20,7 +20,14 @@ Eligible Deductions (Section 30):
   - Rent relief: 20% of annual rent paid (max ₦500,000)
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import accumulate
+
+import numpy as np
+
+from app.core.rounding import round_kobo
 
 
 TAX_BRACKETS: list[tuple[float, float]] = [
@@ -32,11 +39,28 @@ TAX_BRACKETS: list[tuple[float, float]] = [
     (float("inf"), 0.25),
 ]
 
+# Array form of TAX_BRACKETS, built once at import and shared by the scalar
+# and batch paths. Read-only so no caller can corrupt the shared tables.
+_BRACKET_SIZES = np.array([size for size, _ in TAX_BRACKETS], dtype=np.float64)
+_BRACKET_RATES = np.array([rate for _, rate in TAX_BRACKETS], dtype=np.float64)
+_BRACKET_FLOORS = np.concatenate(([0.0], np.cumsum(_BRACKET_SIZES[:-1])))
+_BRACKET_SIZES.flags.writeable = False
+_BRACKET_RATES.flags.writeable = False
+_BRACKET_FLOORS.flags.writeable = False
+
+# Closed form: each bracket's floor and the (kobo-rounded) tax owed on all
+# brackets below it, so one bisect (or searchsorted) replaces the bracket loop.
+_FLOORS: list[float] = _BRACKET_FLOORS.tolist()
+_RATES: list[float] = _BRACKET_RATES.tolist()
+_TAX_BELOW_FLOOR: list[float] = [0.0, *accumulate(round(size * rate, 2) for size, rate in TAX_BRACKETS[:-1])]
+_BRACKET_TAX_BELOW_FLOOR = np.array(_TAX_BELOW_FLOOR, dtype=np.float64)
+_BRACKET_TAX_BELOW_FLOOR.flags.writeable = False
+
 RENT_RELIEF_RATE = 0.20
 RENT_RELIEF_MAX = 500_000.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Deductions:
     pension: float = 0.0
     nhf: float = 0.0
@@ -44,24 +68,27 @@ class Deductions:
     life_insurance: float = 0.0
     housing_loan_interest: float = 0.0
     annual_rent_paid: float = 0.0
+    rent_relief: float = field(init=False, compare=False)
+    total: float = field(init=False, compare=False)
 
-    @property
-    def rent_relief(self) -> float:
-        return min(self.annual_rent_paid * RENT_RELIEF_RATE, RENT_RELIEF_MAX)
-
-    @property
-    def total(self) -> float:
-        return (
+    def __post_init__(self):
+        rent_relief = min(self.annual_rent_paid * RENT_RELIEF_RATE, RENT_RELIEF_MAX)
+        object.__setattr__(self, "rent_relief", rent_relief)
+        object.__setattr__(self, "total", (
             self.pension
             + self.nhf
             + self.nhis
             + self.life_insurance
             + self.housing_loan_interest
-            + self.rent_relief
-        )
+            + rent_relief
+        ))
+
+
+# Shared instance for callers that pass no deductions; avoids rebuilding one per call.
+_NO_DEDUCTIONS = Deductions()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BracketBreakdown:
     bracket_floor: float
     bracket_ceiling: float
@@ -70,7 +97,7 @@ class BracketBreakdown:
     tax_in_bracket: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PITResult:
     gross_income: float
     total_deductions: float
@@ -78,10 +105,91 @@ class PITResult:
     taxable_income: float
     tax_liability: float
     effective_rate: float
-    bracket_breakdown: list[BracketBreakdown] = field(default_factory=list)
+    bracket_breakdown: tuple[BracketBreakdown, ...] = ()
     is_minimum_wage_exempt: bool = False
 
 
+@lru_cache(maxsize=4096, typed=True)
+def _calculate(
+    gross_income: float,
+    deductions: Deductions,
+    is_minimum_wage_earner: bool,
+    include_breakdown: bool,
+) -> PITResult:
+    # Scenario comparisons recompute the same (income, deductions) pairs;
+    # results are frozen so cached hits can be shared.
+    if is_minimum_wage_earner or gross_income <= PITCalculator.MINIMUM_WAGE_ANNUAL:
+        return PITResult(
+            gross_income=gross_income,
+            total_deductions=0.0,
+            deduction_details={},
+            taxable_income=0.0,
+            tax_liability=0.0,
+            effective_rate=0.0,
+            bracket_breakdown=(),
+            is_minimum_wage_exempt=True,
+        )
+
+    total_deductions = deductions.total
+    taxable_income = max(gross_income - total_deductions, 0.0)
+
+    tax_liability = _fast_tax(taxable_income)
+    effective_rate = (tax_liability / gross_income * 100) if gross_income > 0 else 0.0
+
+    deduction_details = {
+        "pension": deductions.pension,
+        "nhf": deductions.nhf,
+        "nhis": deductions.nhis,
+        "life_insurance": deductions.life_insurance,
+        "housing_loan_interest": deductions.housing_loan_interest,
+        "rent_relief": deductions.rent_relief,
+        "annual_rent_paid": deductions.annual_rent_paid,
+    }
+
+    return PITResult(
+        gross_income=gross_income,
+        total_deductions=total_deductions,
+        deduction_details=deduction_details,
+        taxable_income=taxable_income,
+        tax_liability=tax_liability,
+        effective_rate=round(effective_rate, 2),
+        bracket_breakdown=_calculate_brackets(taxable_income) if include_breakdown else (),
+    )
+
+
+def _fast_tax(taxable_income: float) -> float:
+    i = max(bisect_left(_FLOORS, taxable_income) - 1, 0)
+    return round(_TAX_BELOW_FLOOR[i] + round((taxable_income - _FLOORS[i]) * _RATES[i], 2), 2)
+
+
+def _calculate_brackets(taxable_income: float) -> tuple[BracketBreakdown, ...]:
+    breakdown = []
+    remaining = taxable_income
+    cumulative_floor = 0.0
+
+    for bracket_size, rate in TAX_BRACKETS:
+        if remaining <= 0:
+            break
+
+        taxable_in_bracket = min(remaining, bracket_size)
+        tax_in_bracket = taxable_in_bracket * rate
+
+        breakdown.append(
+            BracketBreakdown(
+                bracket_floor=cumulative_floor,
+                bracket_ceiling=cumulative_floor + bracket_size,
+                rate=rate,
+                taxable_in_bracket=round(taxable_in_bracket, 2),
+                tax_in_bracket=round(tax_in_bracket, 2),
+            )
+        )
+
+        remaining -= taxable_in_bracket
+        cumulative_floor += bracket_size
+
+    return tuple(breakdown)
+
+
 class PITCalculator:
     """
     Deterministic Personal Income Tax calculator for Nigerian individuals.
@@ -95,78 +203,37 @@ class PITCalculator:
         gross_income: float,
         deductions: Deductions | None = None,
         is_minimum_wage_earner: bool = False,
+        include_breakdown: bool = True,
     ) -> PITResult:
         if gross_income < 0:
             raise ValueError("Gross income cannot be negative")
 
         if deductions is None:
-            deductions = Deductions()
-
-        if is_minimum_wage_earner or gross_income <= self.MINIMUM_WAGE_ANNUAL:
-            return PITResult(
-                gross_income=gross_income,
-                total_deductions=0.0,
-                deduction_details={},
-                taxable_income=0.0,
-                tax_liability=0.0,
-                effective_rate=0.0,
-                bracket_breakdown=[],
-                is_minimum_wage_exempt=True,
-            )
+            deductions = _NO_DEDUCTIONS
 
-        total_deductions = deductions.total
-        taxable_income = max(gross_income - total_deductions, 0.0)
-
-        bracket_breakdown = self._calculate_brackets(taxable_income)
-        tax_liability = sum(b.tax_in_bracket for b in bracket_breakdown)
-        effective_rate = (tax_liability / gross_income * 100) if gross_income > 0 else 0.0
-
-        deduction_details = {
-            "pension": deductions.pension,
-            "nhf": deductions.nhf,
-            "nhis": deductions.nhis,
-            "life_insurance": deductions.life_insurance,
-            "housing_loan_interest": deductions.housing_loan_interest,
-            "rent_relief": deductions.rent_relief,
-            "annual_rent_paid": deductions.annual_rent_paid,
-        }
+        result = _calculate(gross_income, deductions, is_minimum_wage_earner, include_breakdown)
+        # The cached result is shared between calls; give each caller its own dict.
+        return replace(result, deduction_details=dict(result.deduction_details))
 
-        return PITResult(
-            gross_income=gross_income,
-            total_deductions=total_deductions,
-            deduction_details=deduction_details,
-            taxable_income=taxable_income,
-            tax_liability=round(tax_liability, 2),
-            effective_rate=round(effective_rate, 2),
-            bracket_breakdown=bracket_breakdown,
-        )
-
-    def _calculate_brackets(self, taxable_income: float) -> list[BracketBreakdown]:
-        breakdown = []
-        remaining = taxable_income
-        cumulative_floor = 0.0
-
-        for bracket_size, rate in TAX_BRACKETS:
-            if remaining <= 0:
-                break
-
-            taxable_in_bracket = min(remaining, bracket_size)
-            tax_in_bracket = taxable_in_bracket * rate
-
-            breakdown.append(
-                BracketBreakdown(
-                    bracket_floor=cumulative_floor,
-                    bracket_ceiling=cumulative_floor + bracket_size if bracket_size != float("inf") else float("inf"),
-                    rate=rate,
-                    taxable_in_bracket=round(taxable_in_bracket, 2),
-                    tax_in_bracket=round(tax_in_bracket, 2),
-                )
-            )
+    def calculate_batch(
+        self,
+        gross_incomes: np.ndarray,
+        deductions_totals: np.ndarray | float = 0.0,
+    ) -> np.ndarray:
+        """
+        Tax liability for many taxpayers at once, e.g. a sensitivity sweep over income.
+        Returns only the liabilities; use calculate() when the full breakdown is needed.
+        """
+        gross_incomes = np.asarray(gross_incomes, dtype=np.float64)
+        if (gross_incomes < 0).any():
+            raise ValueError("Gross income cannot be negative")
 
-            remaining -= taxable_in_bracket
-            cumulative_floor += bracket_size
+        taxable = np.maximum(gross_incomes - deductions_totals, 0.0)
+        # Vectorised _fast_tax: one searchsorted per income instead of a pass over every bracket.
+        i = np.maximum(np.searchsorted(_BRACKET_FLOORS, taxable) - 1, 0)
+        tax = _BRACKET_TAX_BELOW_FLOOR[i] + round_kobo((taxable - _BRACKET_FLOORS[i]) * _BRACKET_RATES[i])
 
-        return breakdown
+        return np.where(gross_incomes <= self.MINIMUM_WAGE_ANNUAL, 0.0, round_kobo(tax))
 
     def estimate_monthly_paye(
         self,
@@ -174,7 +241,7 @@ class PITCalculator:
         deductions: Deductions | None = None,
     ) -> dict:
         annual_gross = monthly_gross * 12
-        result = self.calculate(annual_gross, deductions)
+        result = self.calculate(annual_gross, deductions, include_breakdown=False)
         monthly_tax = result.tax_liability / 12
 
         return {
@@ -14,9 +14,13 @@ Key provisions:
   - Section 187: Zero-rated supplies (0%)
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
+import numpy as np
+
+from app.core.rounding import round_kobo
+
 
 class VATCategory(str, Enum):
     STANDARD = "standard"
@@ -27,7 +31,7 @@ class VATCategory(str, Enum):
 VAT_RATE = 0.075
 ZERO_RATE = 0.00
 
-EXEMPT_CATEGORIES = [
+EXEMPT_CATEGORIES = frozenset({
     "medical_pharmaceutical",
     "basic_food_items",
     "books_educational_materials",
@@ -38,16 +42,36 @@ EXEMPT_CATEGORIES = [
     "farming_machinery",
     "locally_produced_sanitary_towels",
     "renewable_energy_equipment",
-]
+})
 
-ZERO_RATED_CATEGORIES = [
+ZERO_RATED_CATEGORIES = frozenset({
     "non_oil_exports",
     "goods_services_to_free_trade_zones",
     "humanitarian_donor_funded_projects",
-]
+})
+
+VAT_CATEGORY_VALUES = frozenset(category.value for category in VATCategory)
+
+# Integer codes for the array-based calculation path.
+VAT_CATEGORY_CODES: dict[VATCategory, int] = {
+    VATCategory.STANDARD: 0,
+    VATCategory.EXEMPT: 1,
+    VATCategory.ZERO_RATED: 2,
+}
+VAT_CATEGORY_BY_CODE: tuple[VATCategory, ...] = tuple(VAT_CATEGORY_CODES)
+VAT_RATE_BY_CODE = np.array([VAT_RATE, ZERO_RATE, ZERO_RATE], dtype=np.float64)
+VAT_RATE_BY_CODE.flags.writeable = False
+
+
+@dataclass(slots=True, frozen=True)
+class VATSupply:
+    """A pre-parsed supply or purchase line for typed batch ingestion."""
+    amount: float
+    category: VATCategory = VATCategory.STANDARD
+    description: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VATLineItem:
     description: str
     amount: float
@@ -56,7 +80,7 @@ class VATLineItem:
     total_with_vat: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VATResult:
     total_supplies: float
     taxable_supplies: float
@@ -66,10 +90,16 @@ class VATResult:
     input_vat: float
     net_vat_payable: float
     effective_rate: float
-    line_items: list[VATLineItem] = field(default_factory=list)
+    line_items: tuple[VATLineItem, ...] = ()
     breakdown: dict = field(default_factory=dict)
 
 
+def _running_sum(values: np.ndarray) -> float:
+    # cumsum adds left to right like a running total; sum() is pairwise and can
+    # land a kobo away after rounding.
+    return float(values.cumsum()[-1]) if values.size else 0.0
+
+
 class VATCalculator:
     """
     Deterministic VAT calculator for Nigerian businesses.
@@ -77,9 +107,10 @@ class VATCalculator:
     """
 
     def classify_supply(self, category: str) -> VATCategory:
-        if category.lower() in EXEMPT_CATEGORIES:
+        category = category.lower()
+        if category in EXEMPT_CATEGORIES:
             return VATCategory.EXEMPT
-        if category.lower() in ZERO_RATED_CATEGORIES:
+        if category in ZERO_RATED_CATEGORIES:
             return VATCategory.ZERO_RATED
         return VATCategory.STANDARD
 
@@ -88,64 +119,143 @@ class VATCalculator:
             return 0.0
         return round(amount * VAT_RATE, 2)
 
+    def _category_of(self, cat_str: str) -> VATCategory:
+        return VATCategory(cat_str) if cat_str in VAT_CATEGORY_VALUES else self.classify_supply(cat_str)
+
+    def _canonicalize_categories(self, rows: list[dict]) -> np.ndarray:
+        return np.fromiter(
+            (VAT_CATEGORY_CODES[self._category_of(row.get("category", "standard"))] for row in rows),
+            dtype=np.int8,
+            count=len(rows),
+        )
+
     def calculate(
         self,
         output_supplies: list[dict] | None = None,
         input_purchases: list[dict] | None = None,
+        include_line_items: bool = True,
     ) -> VATResult:
         if output_supplies is None:
             output_supplies = []
         if input_purchases is None:
             input_purchases = []
 
-        total_supplies = 0.0
-        taxable_supplies = 0.0
-        exempt_supplies = 0.0
-        zero_rated_supplies = 0.0
-        output_vat = 0.0
-        line_items = []
-
-        for supply in output_supplies:
-            amount = supply.get("amount", 0.0)
-            desc = supply.get("description", "")
-            cat_str = supply.get("category", "standard")
-            category = self.classify_supply(cat_str) if cat_str not in VATCategory.__members__.values() else VATCategory(cat_str)
-
-            vat_amount = self.calculate_vat_on_supply(amount, category)
-            total_supplies += amount
-
-            if category == VATCategory.STANDARD:
-                taxable_supplies += amount
-                output_vat += vat_amount
-            elif category == VATCategory.EXEMPT:
-                exempt_supplies += amount
-            elif category == VATCategory.ZERO_RATED:
-                zero_rated_supplies += amount
-
-            line_items.append(VATLineItem(
-                description=desc,
+        output_amounts = np.fromiter(
+            (s.get("amount", 0.0) for s in output_supplies), dtype=np.float64, count=len(output_supplies),
+        )
+        output_codes = self._canonicalize_categories(output_supplies)
+        input_amounts = np.fromiter(
+            (p.get("amount", 0.0) for p in input_purchases), dtype=np.float64, count=len(input_purchases),
+        )
+
+        result = self.calculate_from_arrays(
+            output_amounts,
+            output_codes,
+            input_amounts,
+            self._canonicalize_categories(input_purchases),
+        )
+
+        if include_line_items:
+            result = replace(result, line_items=self._line_items(
+                [s.get("description", "") for s in output_supplies],
+                [s.get("amount", 0.0) for s in output_supplies],
+                output_amounts,
+                output_codes,
+            ))
+
+        return result
+
+    def calculate_supplies(
+        self,
+        output_supplies: list[VATSupply],
+        input_purchases: list[VATSupply] | None = None,
+        include_line_items: bool = True,
+    ) -> VATResult:
+        """Same as calculate(), for supplies already parsed into VATSupply rows."""
+        if input_purchases is None:
+            input_purchases = []
+
+        output_amounts = np.fromiter(
+            (s.amount for s in output_supplies), dtype=np.float64, count=len(output_supplies),
+        )
+        output_codes = np.fromiter(
+            (VAT_CATEGORY_CODES[s.category] for s in output_supplies), dtype=np.int8, count=len(output_supplies),
+        )
+
+        result = self.calculate_from_arrays(
+            output_amounts,
+            output_codes,
+            np.fromiter((p.amount for p in input_purchases), dtype=np.float64, count=len(input_purchases)),
+            np.fromiter(
+                (VAT_CATEGORY_CODES[p.category] for p in input_purchases), dtype=np.int8, count=len(input_purchases),
+            ),
+        )
+
+        if include_line_items:
+            result = replace(result, line_items=self._line_items(
+                [s.description for s in output_supplies],
+                [s.amount for s in output_supplies],
+                output_amounts,
+                output_codes,
+            ))
+
+        return result
+
+    @staticmethod
+    def _line_items(
+        descriptions: list[str],
+        amounts: list[float],
+        amount_array: np.ndarray,
+        codes: np.ndarray,
+    ) -> tuple[VATLineItem, ...]:
+        vat_amounts = round_kobo(amount_array * VAT_RATE_BY_CODE[codes]).tolist()
+        return tuple(
+            VATLineItem(
+                description=description,
                 amount=amount,
-                category=category,
+                category=VAT_CATEGORY_BY_CODE[code],
                 vat_amount=vat_amount,
                 total_with_vat=amount + vat_amount,
-            ))
+            )
+            for description, amount, code, vat_amount in zip(descriptions, amounts, codes.tolist(), vat_amounts)
+        )
+
+    def calculate_from_arrays(
+        self,
+        output_amounts: np.ndarray,
+        output_codes: np.ndarray,
+        input_amounts: np.ndarray | None = None,
+        input_codes: np.ndarray | None = None,
+    ) -> VATResult:
+        """
+        VAT return totals from parallel amount / VAT_CATEGORY_CODES arrays.
+        Line items are not built; use calculate() for an itemised result.
+        """
+        output_amounts = np.asarray(output_amounts, dtype=np.float64)
+        output_codes = np.asarray(output_codes)
+        if input_amounts is None:
+            input_amounts = np.empty(0)
+            input_codes = np.empty(0, dtype=np.int8)
 
-        input_vat = 0.0
-        for purchase in input_purchases:
-            amount = purchase.get("amount", 0.0)
-            cat_str = purchase.get("category", "standard")
-            category = self.classify_supply(cat_str) if cat_str not in VATCategory.__members__.values() else VATCategory(cat_str)
+        standard = output_codes == VAT_CATEGORY_CODES[VATCategory.STANDARD]
+        total_supplies = _running_sum(output_amounts)
+        taxable_supplies = _running_sum(output_amounts[standard])
+        exempt_supplies = _running_sum(output_amounts[output_codes == VAT_CATEGORY_CODES[VATCategory.EXEMPT]])
+        zero_rated_supplies = _running_sum(output_amounts[output_codes == VAT_CATEGORY_CODES[VATCategory.ZERO_RATED]])
+        output_vat = _running_sum(round_kobo(output_amounts * VAT_RATE_BY_CODE[output_codes]))
 
-            if category == VATCategory.STANDARD:
-                input_vat += round(amount * VAT_RATE, 2)
+        input_amounts = np.asarray(input_amounts, dtype=np.float64)
+        input_vat = _running_sum(round_kobo(input_amounts * VAT_RATE_BY_CODE[input_codes]))
 
         net_vat_payable = round(output_vat - input_vat, 2)
         effective_rate = (output_vat / taxable_supplies * 100) if taxable_supplies > 0 else 0.0
+        output_vat_rounded = round(output_vat, 2)
+        input_vat_rounded = round(input_vat, 2)
 
         breakdown = {
             "vat_rate": VAT_RATE * 100,
-            "output_vat": round(output_vat, 2),
-            "input_vat": round(input_vat, 2),
+            "output_vat": output_vat_rounded,
+            "input_vat": input_vat_rounded,
             "net_payable": net_vat_payable,
         }
 
@@ -154,11 +264,10 @@ class VATCalculator:
             taxable_supplies=round(taxable_supplies, 2),
             exempt_supplies=round(exempt_supplies, 2),
             zero_rated_supplies=round(zero_rated_supplies, 2),
-            output_vat=round(output_vat, 2),
-            input_vat=round(input_vat, 2),
+            output_vat=output_vat_rounded,
+            input_vat=input_vat_rounded,
             net_vat_payable=net_vat_payable,
             effective_rate=round(effective_rate, 2),
-            line_items=line_items,
             breakdown=breakdown,
         )
 
@@ -17,6 +17,12 @@ Common WHT Rates:
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from app.core.rounding import round_kobo
 
 
 class RecipientType(str, Enum):
@@ -56,8 +62,35 @@ WHT_RATES: dict[WHTPaymentType, dict[RecipientType, float]] = {
     WHTPaymentType.DIRECTORS_FEES: {RecipientType.INDIVIDUAL: 0.10, RecipientType.COMPANY: 0.10},
 }
 
+# One (payment type, recipient type) probe per lookup instead of two nested ones.
+_FLAT_WHT_RATES = MappingProxyType({
+    (payment_type, recipient_type): rate
+    for payment_type, rates in WHT_RATES.items()
+    for recipient_type, rate in rates.items()
+})
+
+_PAYMENT_TYPES: tuple[WHTPaymentType, ...] = tuple(WHTPaymentType)
+_RECIPIENT_TYPES: tuple[RecipientType, ...] = tuple(RecipientType)
+# Keyed by the raw string values so batch rows skip Enum.__call__; str-enum
+# members hash equal to their values and hit the same entries.
+_PAYMENT_TYPE_INDEX = {payment_type.value: i for i, payment_type in enumerate(_PAYMENT_TYPES)}
+_RECIPIENT_TYPE_INDEX = {recipient_type.value: i for i, recipient_type in enumerate(_RECIPIENT_TYPES)}
+
+# WHT_RATES as a (payment type, recipient type) matrix for the batch path.
+_RATE_MATRIX = np.array(
+    [[_FLAT_WHT_RATES[pt, rt] for rt in _RECIPIENT_TYPES] for pt in _PAYMENT_TYPES], dtype=np.float64,
+)
+_RATE_MATRIX.flags.writeable = False
+
 
-@dataclass
+def _ordinals(values: list, index: dict[str, int], enum_cls: type[Enum]) -> np.ndarray:
+    ordinals = np.fromiter((index.get(value, -1) for value in values), dtype=np.intp, count=len(values))
+    if (ordinals < 0).any():
+        enum_cls(values[int(np.argmax(ordinals < 0))])  # raises the usual ValueError
+    return ordinals
+
+
+@dataclass(slots=True, frozen=True)
 class WHTLineItem:
     payment_type: WHTPaymentType
     recipient_type: RecipientType
@@ -67,29 +100,60 @@ class WHTLineItem:
     net_amount: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WHTResult:
     total_gross: float
     total_wht: float
     total_net: float
-    line_items: list[WHTLineItem] = field(default_factory=list)
+    line_items: tuple[WHTLineItem, ...] = ()
     breakdown: dict = field(default_factory=dict)
 
 
+def _rate(payment_type: WHTPaymentType, recipient_type: RecipientType) -> float:
+    rate = _FLAT_WHT_RATES.get((payment_type, recipient_type))
+    if rate is None:
+        if payment_type not in WHT_RATES:
+            raise ValueError(f"Unknown payment type: {payment_type}")
+        return 0.10
+    return rate
+
+
+# Pure in its arguments and WHTLineItem is frozen, so cached items are safe to share.
+@lru_cache(maxsize=4096, typed=True)
+def _calculate_single(
+    gross_amount: float,
+    payment_type: WHTPaymentType,
+    recipient_type: RecipientType,
+) -> WHTLineItem:
+    rate = _rate(payment_type, recipient_type)
+    wht_amount = round(gross_amount * rate, 2)
+    net_amount = round(gross_amount - wht_amount, 2)
+
+    return WHTLineItem(
+        payment_type=payment_type,
+        recipient_type=recipient_type,
+        gross_amount=gross_amount,
+        wht_rate=rate,
+        wht_amount=wht_amount,
+        net_amount=net_amount,
+    )
+
+
 class WHTCalculator:
     """
     Deterministic Withholding Tax calculator for Nigerian transactions.
     All calculations follow the Nigeria Tax Act 2025.
+
+    Holds no state: the methods are static and can be called on the class or
+    on the shared ``wht_calc`` instance.
     """
 
-    def get_rate(self, payment_type: WHTPaymentType, recipient_type: RecipientType) -> float:
-        rates = WHT_RATES.get(payment_type)
-        if rates is None:
-            raise ValueError(f"Unknown payment type: {payment_type}")
-        return rates.get(recipient_type, 0.10)
+    @staticmethod
+    def get_rate(payment_type: WHTPaymentType, recipient_type: RecipientType) -> float:
+        return _rate(payment_type, recipient_type)
 
+    @staticmethod
     def calculate_single(
-        self,
         gross_amount: float,
         payment_type: WHTPaymentType,
         recipient_type: RecipientType = RecipientType.COMPANY,
@@ -97,46 +161,62 @@ class WHTCalculator:
         if gross_amount < 0:
             raise ValueError("Gross amount cannot be negative")
 
-        rate = self.get_rate(payment_type, recipient_type)
-        wht_amount = round(gross_amount * rate, 2)
-        net_amount = round(gross_amount - wht_amount, 2)
-
-        return WHTLineItem(
-            payment_type=payment_type,
-            recipient_type=recipient_type,
-            gross_amount=gross_amount,
-            wht_rate=rate,
-            wht_amount=wht_amount,
-            net_amount=net_amount,
-        )
+        return _calculate_single(gross_amount, payment_type, recipient_type)
 
+    @staticmethod
     def calculate_batch(
-        self,
         payments: list[dict],
+        include_line_items: bool = True,
     ) -> WHTResult:
-        line_items = []
-        total_gross = 0.0
-        total_wht = 0.0
-
-        for payment in payments:
-            gross = payment.get("amount", 0.0)
-            ptype = WHTPaymentType(payment.get("payment_type", "contract"))
-            rtype = RecipientType(payment.get("recipient_type", "company"))
+        count = len(payments)
+        pt_idx = _ordinals(
+            [p.get("payment_type", "contract") for p in payments], _PAYMENT_TYPE_INDEX, WHTPaymentType,
+        )
+        rt_idx = _ordinals(
+            [p.get("recipient_type", "company") for p in payments], _RECIPIENT_TYPE_INDEX, RecipientType,
+        )
+        amounts = np.fromiter((p.get("amount", 0.0) for p in payments), dtype=np.float64, count=count)
+        if (amounts < 0).any():
+            raise ValueError("Gross amount cannot be negative")
 
-            item = self.calculate_single(gross, ptype, rtype)
-            line_items.append(item)
-            total_gross += gross
-            total_wht += item.wht_amount
+        rates = _RATE_MATRIX[pt_idx, rt_idx]
+        wht = round_kobo(amounts * rates)
 
+        # cumsum adds left to right like the scalar running total; sum() is pairwise
+        # and can land on the other side of a kobo.
+        total_gross = float(amounts.cumsum()[-1]) if count else 0.0
+        total_wht = float(wht.cumsum()[-1]) if count else 0.0
         total_net = round(total_gross - total_wht, 2)
 
+        # bincount accumulates in input order, matching a running per-type sum.
+        gross_by_type = np.bincount(pt_idx, weights=amounts, minlength=len(_PAYMENT_TYPES)).tolist()
+        wht_by_type = np.bincount(pt_idx, weights=wht, minlength=len(_PAYMENT_TYPES)).tolist()
+        _, first_seen = np.unique(pt_idx, return_index=True)
         breakdown_by_type = {}
-        for item in line_items:
-            key = item.payment_type.value
-            if key not in breakdown_by_type:
-                breakdown_by_type[key] = {"gross": 0.0, "wht": 0.0, "rate": item.wht_rate * 100}
-            breakdown_by_type[key]["gross"] += item.gross_amount
-            breakdown_by_type[key]["wht"] += item.wht_amount
+        for i in np.sort(first_seen).tolist():
+            type_index = int(pt_idx[i])
+            breakdown_by_type[_PAYMENT_TYPES[type_index].value] = {
+                "gross": gross_by_type[type_index],
+                "wht": wht_by_type[type_index],
+                "rate": float(rates[i]) * 100,
+            }
+
+        line_items = ()
+        if include_line_items:
+            net = round_kobo(amounts - wht)
+            line_items = tuple(
+                WHTLineItem(
+                    payment_type=_PAYMENT_TYPES[pt],
+                    recipient_type=_RECIPIENT_TYPES[rt],
+                    gross_amount=gross,
+                    wht_rate=rate,
+                    wht_amount=wht_amount,
+                    net_amount=net_amount,
+                )
+                for pt, rt, gross, rate, wht_amount, net_amount in zip(
+                    pt_idx.tolist(), rt_idx.tolist(), amounts.tolist(), rates.tolist(), wht.tolist(), net.tolist(),
+                )
+            )
 
         return WHTResult(
             total_gross=round(total_gross, 2),
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import get_settings
@@ -20,15 +21,18 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Explicit origins and headers: a "*" origin is rejected by browsers alongside
+# credentials, and fixed lists let preflights reuse one precomputed header set.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for development
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["*"],
+    allow_headers=["authorization", "content-type"],
+    expose_headers=["X-Conversation-Id"],  # read by the frontend after a streamed chat reply
     max_age=86400,
 )
 
@@ -40,6 +44,9 @@ app.include_router(reports.router, prefix="/api/v1/reports", tags=["reports"])
 app.include_router(billing.router, prefix="/api/v1/billing", tags=["billing"])
 
 
+_HEALTH = {"status": "healthy", "version": settings.APP_VERSION}
+
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "version": settings.APP_VERSION}
+    return _HEALTH
@@ -1,6 +1,6 @@
 from app.models.base import Base
 from app.models.user import User, UserProfile
-from app.models.transaction import Transaction
+from app.models.transaction import Transaction, TransactionMonthlyRollup
 from app.models.tax import TaxCalculation, TaxDeduction, ComplianceItem
 from app.models.chat import ChatConversation, ChatMessage
 from app.models.billing import Subscription, PaymentHistory
@@ -10,6 +10,7 @@ __all__ = [
     "User",
     "UserProfile",
     "Transaction",
+    "TransactionMonthlyRollup",
     "TaxCalculation",
     "TaxDeduction",
     "ComplianceItem",
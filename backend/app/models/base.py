@@ -1,3 +1,5 @@
+import os
+import time
 import uuid
 from datetime import datetime
 
@@ -6,6 +8,14 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def uuid7() -> uuid.UUID:
+    """RFC 9562 UUIDv7: 48-bit Unix millisecond timestamp, then random bits."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -20,6 +30,8 @@ class TimestampMixin:
 
 
 class UUIDMixin:
+    # Time-ordered so inserts append to the primary key index; ORDER BY id
+    # roughly follows creation order. Matches uuid_generate_v7() in migration 003.
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
@@ -4,7 +4,7 @@ import uuid
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Float, Enum, ForeignKey, Boolean, DateTime
+from sqlalchemy import String, Float, Enum, ForeignKey, Boolean, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -28,6 +28,9 @@ class PaymentStatus(str, PyEnum):
 
 class Subscription(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        Index("idx_subscriptions_provider_subscription_id", "provider_subscription_id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False
@@ -4,7 +4,7 @@ import uuid
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Enum, ForeignKey, Text
+from sqlalchemy import String, Enum, ForeignKey, Text, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -31,12 +31,15 @@ class ChatConversation(Base, UUIDMixin, TimestampMixin):
 
     user: Mapped["User"] = relationship(back_populates="conversations")
     messages: Mapped[list["ChatMessage"]] = relationship(
-        back_populates="conversation", order_by="ChatMessage.created_at"
+        back_populates="conversation", order_by="ChatMessage.created_at", lazy="raise"
     )
 
 
 class ChatMessage(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        Index("idx_chat_messages_created_at", "conversation_id", "created_at"),
+    )
 
     conversation_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -4,7 +4,7 @@ import uuid
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Float, Enum, ForeignKey, Integer, Boolean, Text, Date
+from sqlalchemy import String, Float, Enum, ForeignKey, Integer, Boolean, Text, Date, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -28,6 +28,10 @@ class ComplianceStatus(str, PyEnum):
 
 class TaxCalculation(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "tax_calculations"
+    __table_args__ = (
+        Index("idx_tax_calculations_user_year", "user_id", "year"),
+        Index("idx_tax_calculations_user_year_type", "user_id", "year", "tax_type"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
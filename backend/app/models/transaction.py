@@ -4,7 +4,7 @@ import uuid
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Float, Enum, ForeignKey, Date, Text
+from sqlalchemy import String, Float, Enum, ForeignKey, Date, Text, Index, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -57,6 +57,10 @@ class Currency(str, PyEnum):
 
 class Transaction(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("idx_transactions_user_date", "user_id", "transaction_date"),
+        Index("idx_transactions_user_type_date", "user_id", "transaction_type", "transaction_date"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
@@ -85,3 +89,21 @@ class Transaction(Base, UUIDMixin, TimestampMixin):
     ai_classified: Mapped[bool] = mapped_column(default=False)
 
     user: Mapped["User"] = relationship(back_populates="transactions")
+
+
+class TransactionMonthlyRollup(Base):
+    """Per-user monthly totals maintained by a trigger on transactions (migration 004)."""
+
+    __tablename__ = "transaction_monthly_rollups"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    month: Mapped[int] = mapped_column(Integer, primary_key=True)
+    transaction_type: Mapped[TransactionType] = mapped_column(
+        Enum(TransactionType, name="transaction_type_enum"), primary_key=True
+    )
+    category: Mapped[str] = mapped_column(String(50), primary_key=True)
+    total_ngn: Mapped[float] = mapped_column(Float, default=0.0)
+    transaction_count: Mapped[int] = mapped_column(Integer, default=0)
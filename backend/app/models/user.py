@@ -43,10 +43,11 @@ class User(Base, UUIDMixin, TimestampMixin):
         default=SubscriptionTier.FREE,
     )
 
-    profile: Mapped["UserProfile"] = relationship(back_populates="user", uselist=False)
-    transactions: Mapped[list["Transaction"]] = relationship(back_populates="user")
-    conversations: Mapped[list["ChatConversation"]] = relationship(back_populates="user")
-    subscription: Mapped["Subscription"] = relationship(back_populates="user", uselist=False)
+    # lazy="raise": load these explicitly with selectinload() so N+1 access fails loudly.
+    profile: Mapped["UserProfile"] = relationship(back_populates="user", uselist=False, lazy="raise")
+    transactions: Mapped[list["Transaction"]] = relationship(back_populates="user", lazy="raise")
+    conversations: Mapped[list["ChatConversation"]] = relationship(back_populates="user", lazy="raise")
+    subscription: Mapped["Subscription"] = relationship(back_populates="user", uselist=False, lazy="raise")
 
 
 class UserProfile(Base, UUIDMixin, TimestampMixin):
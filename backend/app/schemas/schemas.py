@@ -106,6 +106,10 @@ class TransactionCreate(BaseModel):
     is_capital: bool = False
 
 
+class TransactionBulkCreate(BaseModel):
+    transactions: list[TransactionCreate] = Field(..., min_length=1, max_length=1000)
+
+
 class TransactionResponse(BaseModel):
     id: UUID
     user_id: UUID
@@ -174,6 +178,7 @@ class ScenarioRequest(BaseModel):
     current_deductions: dict | None = None
     projected_deductions: dict | None = None
     business_expenses: float = 0
+    include_insights: bool = True
 
 
 # ── Chat Schemas ──
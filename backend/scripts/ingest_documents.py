@@ -5,14 +5,20 @@ via Supabase for retrieval-augmented generation.
 
 Usage:
     python -m scripts.ingest_documents --file path/to/document.pdf --name "Nigeria Tax Act 2025"
+    python -m scripts.ingest_documents --serve < documents.txt
 """
 
 import argparse
+import hashlib
 import os
+import re
 import sys
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 from dotenv import load_dotenv
 from sentence_transformers import SentenceTransformer
 from supabase import create_client
@@ -24,18 +30,43 @@ SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 CHUNK_SIZE = 512
 CHUNK_OVERLAP = 64
+UPLOAD_BATCH_SIZE = 500  # rows per PostgREST insert (~3 MB of JSON with 384-dim embeddings)
+UPLOAD_IN_FLIGHT = 2  # inserts allowed to run while the next batch is embedded
+ONNX_MODEL_DIR = Path(__file__).resolve().parent / "onnx_minilm"
+MAX_SEQ_LENGTH = 256  # all-MiniLM-L6-v2's sentence-transformers truncation length
 
+# ingested_documents columns that must all match for a re-run to be skipped.
+FINGERPRINT_COLUMNS = "sha256,chunk_size,chunk_overlap,embedding_backend"
+
+_WHITESPACE = re.compile(r"\s+")
+_SPACE = re.compile(" ")
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from a PDF file using PyMuPDF (fitz)."""
-    import fitz
 
-    doc = fitz.open(file_path)
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    doc.close()
-    return text
+def extract_text_from_pdf(file_path: str) -> str:
+    """
+    Extract text from a PDF file with PDFium (pypdfium2, installed with pdfplumber),
+    falling back to PyMuPDF (fitz) if it is unavailable.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        import fitz
+
+        with fitz.open(file_path) as doc:
+            return "".join(page.get_text() for page in doc)
+
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        parts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            parts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    # Pages are newline-separated so words never merge across a page break.
+    return "\n".join(parts)
 
 
 def extract_text_from_txt(file_path: str) -> str:
@@ -60,104 +91,337 @@ def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVE
     Split text into overlapping chunks by sentences.
     Each chunk is roughly `chunk_size` words with `overlap` words of overlap.
     """
-    words = text.split()
+    # Collapse whitespace once so every chunk is a plain slice of the text
+    # instead of a re-join of a document-sized word list.
+    text = _WHITESPACE.sub(" ", text).strip()
+    if not text:
+        return []
+    word_starts = [0, *(m.end() for m in _SPACE.finditer(text))]
+    total_words = len(word_starts)
+
     chunks = []
-    start = 0
+    for start in range(0, total_words, chunk_size - overlap):
+        end = min(start + chunk_size, total_words)
+        content = text[word_starts[start]:word_starts[end] - 1 if end < total_words else len(text)]
+        chunks.append({
+            "index": len(chunks),
+            "content": content,
+            "word_count": end - start,
+            "char_count": len(content),
+        })
 
-    while start < len(words):
-        end = min(start + chunk_size, len(words))
-        chunk_words = words[start:end]
-        chunk_text = " ".join(chunk_words)
+    return chunks
 
-        # Clean up whitespace
-        chunk_text = " ".join(chunk_text.split())
 
-        if chunk_text.strip():
-            chunks.append({
-                "index": len(chunks),
-                "content": chunk_text,
-                "word_count": len(chunk_words),
-                "char_count": len(chunk_text),
-            })
+def load_model() -> SentenceTransformer:
+    """Load the embedding model, in half precision on a CUDA device when one is available."""
+    import torch
 
-        start += chunk_size - overlap
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    if device == "cpu":
+        torch.set_num_threads(os.cpu_count() or 1)
+    model = SentenceTransformer(EMBEDDING_MODEL, device=device)
+    if device == "cuda":
+        model.half()
+    return model
 
-    return chunks
 
+class OnnxEncoder:
+    """
+    int8-quantised ONNX Runtime stand-in for SentenceTransformer.encode on CPU hosts.
+    Reproduces the model's mean pooling and L2 normalisation.
+
+    Requires the optional optimum[onnxruntime] package. The export and quantisation
+    happen once and are cached in ONNX_MODEL_DIR.
+    """
 
-def embed_chunks(chunks: list[dict], model: SentenceTransformer) -> list[dict]:
-    """Generate embeddings for each chunk."""
+    def __init__(self, model_dir: Path = ONNX_MODEL_DIR):
+        from onnxruntime import InferenceSession, SessionOptions
+        from transformers import AutoTokenizer
+
+        quantized = model_dir / "model_int8.onnx"
+        if not quantized.exists():
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            from optimum.onnxruntime import ORTModelForFeatureExtraction
+
+            ORTModelForFeatureExtraction.from_pretrained(EMBEDDING_MODEL, export=True).save_pretrained(model_dir)
+            AutoTokenizer.from_pretrained(EMBEDDING_MODEL).save_pretrained(model_dir)
+            quantize_dynamic(model_dir / "model.onnx", quantized, weight_type=QuantType.QInt8)
+
+        options = SessionOptions()
+        options.intra_op_num_threads = os.cpu_count() or 1
+        self.session = InferenceSession(str(quantized), options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+
+    def encode(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        normalize_embeddings: bool = True,
+    ) -> np.ndarray:
+        # Length-sorted batches keep padding down, as SentenceTransformer.encode does.
+        order = np.argsort([-len(t) for t in texts], kind="stable")
+        embeddings = np.empty((len(texts), 0), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            batch = [texts[i] for i in order[start:start + batch_size]]
+            inputs = self.tokenizer(
+                batch, padding=True, truncation=True, max_length=MAX_SEQ_LENGTH, return_tensors="np",
+            )
+            hidden = self.session.run(None, {k: v for k, v in inputs.items() if k in self.input_names})[0]
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if normalize_embeddings:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            if embeddings.shape[1] == 0:
+                embeddings = np.empty((len(texts), pooled.shape[1]), dtype=np.float32)
+            embeddings[order[start:start + batch_size]] = pooled
+            if show_progress_bar:
+                print(f"  Embedded {min(start + batch_size, len(texts))}/{len(texts)} chunks")
+        return embeddings
+
+
+def embed_chunks(
+    chunks: list[dict],
+    model: SentenceTransformer | OnnxEncoder,
+    show_progress_bar: bool = True,
+    gpu_pool: dict | None = None,
+) -> list[dict]:
+    """Generate embeddings for each chunk, spread over every GPU in `gpu_pool` if given."""
     texts = [c["content"] for c in chunks]
-    embeddings = model.encode(texts, show_progress_bar=True, normalize_embeddings=True)
+    if gpu_pool is not None:
+        embeddings = model.encode_multi_process(texts, gpu_pool, batch_size=128, normalize_embeddings=True)
+    else:
+        embeddings = model.encode(texts, show_progress_bar=show_progress_bar, normalize_embeddings=True)
 
-    for i, chunk in enumerate(chunks):
-        chunk["embedding"] = embeddings[i].tolist()
+    for chunk, embedding in zip(chunks, np.asarray(embeddings, dtype=np.float32)):
+        chunk["embedding"] = _vector_literal(embedding)
 
     return chunks
 
 
-def upload_to_supabase(chunks: list[dict], document_name: str):
-    """Upload chunks with embeddings to Supabase document_embeddings table."""
+def start_gpu_pool(model: SentenceTransformer | OnnxEncoder) -> dict | None:
+    """Start one encode worker per GPU on multi-GPU hosts; None means encode in-process."""
+    if not isinstance(model, SentenceTransformer):
+        return None
+    import torch
+
+    if torch.cuda.device_count() < 2:
+        return None
+    return model.start_multi_process_pool()
+
+
+def _vector_literal(embedding: np.ndarray) -> str:
+    # pgvector stores float32, which 9 significant digits round-trip exactly; the
+    # default float64 repr of .tolist() spends ~40% more bytes on noise digits.
+    return "[" + ",".join(map("{:.9g}".format, embedding.tolist())) + "]"
+
+
+def _rows(batch: list[dict], document_name: str) -> list[dict]:
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "document_name": document_name,
+            "chunk_index": chunk["index"],
+            "content": chunk["content"],
+            "metadata": {
+                "word_count": chunk["word_count"],
+                "char_count": chunk["char_count"],
+            },
+            "embedding": chunk["embedding"],
+        }
+        for chunk in batch
+    ]
+
+
+def _insert(supabase, rows: list[dict]) -> int:
+    # Don't echo the inserted rows (and their embeddings) back over the wire.
+    supabase.table("document_embeddings").insert(rows, returning="minimal").execute()
+    return len(rows)
+
+
+def get_supabase_client():
     if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
         raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in .env")
+    return create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
 
-    supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+
+def embed_and_upload(
+    chunks: list[dict],
+    model: SentenceTransformer | OnnxEncoder,
+    document_name: str,
+    supabase=None,
+    gpu_pool: dict | None = None,
+) -> int:
+    """
+    Embed chunks batch by batch and upload each batch on a background thread,
+    so the HTTP insert of batch N overlaps with embedding batch N+1.
+    At most UPLOAD_IN_FLIGHT embedded batches are held in memory at once.
+    `gpu_pool` comes from start_gpu_pool() and is owned by the caller.
+    """
+    if supabase is None:
+        supabase = get_supabase_client()
 
     # Delete existing chunks for this document (re-ingestion)
     supabase.table("document_embeddings").delete().eq("document_name", document_name).execute()
 
-    batch_size = 50
     total = len(chunks)
+    uploaded = 0
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=UPLOAD_IN_FLIGHT) as pool:
+        for i in range(0, total, UPLOAD_BATCH_SIZE):
+            batch = embed_chunks(
+                chunks[i:i + UPLOAD_BATCH_SIZE], model, show_progress_bar=False, gpu_pool=gpu_pool,
+            )
+            if len(pending) == UPLOAD_IN_FLIGHT:
+                uploaded += pending.popleft().result()
+                print(f"  Uploaded {uploaded}/{total} chunks")
+            pending.append(pool.submit(_insert, supabase, _rows(batch, document_name)))
+
+        while pending:
+            uploaded += pending.popleft().result()
+            print(f"  Uploaded {uploaded}/{total} chunks")
+
+    return uploaded
+
+
+def file_sha256(file_path: str) -> str:
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def embedding_backend(model: SentenceTransformer | OnnxEncoder) -> str:
+    if isinstance(model, OnnxEncoder):
+        return f"{EMBEDDING_MODEL}:onnx-int8"
+    return EMBEDDING_MODEL
+
+
+def ingested_fingerprint(supabase, document_name: str) -> dict | None:
+    result = supabase.table("ingested_documents").select(FINGERPRINT_COLUMNS).eq("name", document_name).execute()
+    return result.data[0] if result.data else None
+
+
+def ingest_file(
+    file_path: str,
+    document_name: str,
+    model: SentenceTransformer | OnnxEncoder,
+    supabase=None,
+    chunk_size: int = CHUNK_SIZE,
+    overlap: int = CHUNK_OVERLAP,
+    force: bool = False,
+    gpu_pool: dict | None = None,
+) -> int:
+    """
+    Extract, chunk, embed and upload one document. Returns the number of chunks ingested,
+    or 0 if a byte-identical file was already ingested under the same name with the same
+    chunking and embedding settings (unless force).
+    """
+    if supabase is None:
+        supabase = get_supabase_client()
+
+    fingerprint = {
+        "sha256": file_sha256(file_path),
+        "chunk_size": chunk_size,
+        "chunk_overlap": overlap,
+        "embedding_backend": embedding_backend(model),
+    }
+    if not force and ingested_fingerprint(supabase, document_name) == fingerprint:
+        print(f"⏭️  '{document_name}' is already ingested from this file with these settings; skipping")
+        return 0
 
-    for i in range(0, total, batch_size):
-        batch = chunks[i:i + batch_size]
-        rows = []
-        for chunk in batch:
-            rows.append({
-                "id": str(uuid.uuid4()),
-                "document_name": document_name,
-                "chunk_index": chunk["index"],
-                "content": chunk["content"],
-                "metadata": {
-                    "word_count": chunk["word_count"],
-                    "char_count": chunk["char_count"],
-                },
-                "embedding": chunk["embedding"],
-            })
-
-        supabase.table("document_embeddings").insert(rows).execute()
-        print(f"  Uploaded {min(i + batch_size, total)}/{total} chunks")
+    print(f"📄 Extracting text from: {file_path}")
+    text = extract_text(file_path)
+    print(f"   Extracted {len(text):,} characters")
+
+    print(f"✂️  Chunking text (size={chunk_size}, overlap={overlap})")
+    chunks = chunk_text(text, chunk_size=chunk_size, overlap=overlap)
+    print(f"   Created {len(chunks)} chunks")
+
+    print(f"🧠 Embedding with {EMBEDDING_MODEL} and uploading to Supabase as '{document_name}'")
+    # Forget the old fingerprint before its chunks are replaced, so a run that fails
+    # part-way can never be skipped next time on the strength of the old one.
+    supabase.table("ingested_documents").delete().eq("name", document_name).execute()
+    embed_and_upload(chunks, model, document_name, supabase, gpu_pool)
+    # Recorded only after every batch is in, so a failed run is retried in full.
+    supabase.table("ingested_documents").upsert(
+        {"name": document_name, **fingerprint, "chunk_count": len(chunks)},
+        returning="minimal",
+    ).execute()
+    print(f"✅ Done! {len(chunks)} chunks ingested for '{document_name}'")
+    return len(chunks)
+
+
+def serve(args, model: SentenceTransformer | OnnxEncoder, gpu_pool: dict | None = None):
+    """
+    Ingest documents listed on stdin, one per line as "path" or "path<TAB>name",
+    reusing the loaded model and Supabase client. The name defaults to the file stem.
+    """
+    model.encode(["warmup"] * 8)
+    supabase = get_supabase_client()
+    print("Ready: enter a document path per line (Ctrl-D to exit)", flush=True)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        file_path, _, document_name = line.partition("\t")
+        document_name = document_name.strip() or Path(file_path).stem
+        if not os.path.exists(file_path):
+            print(f"Error: File not found: {file_path}", flush=True)
+            continue
+        try:
+            ingest_file(
+                file_path, document_name, model, supabase, args.chunk_size, args.overlap, args.force, gpu_pool,
+            )
+        except Exception as e:
+            print(f"Error: failed to ingest {file_path}: {e}", flush=True)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Ingest documents into KudiWise RAG")
-    parser.add_argument("--file", required=True, help="Path to the document file (.pdf, .txt, .md)")
-    parser.add_argument("--name", required=True, help="Document name (e.g., 'Nigeria Tax Act 2025')")
+    parser.add_argument("--file", help="Path to the document file (.pdf, .txt, .md)")
+    parser.add_argument("--name", help="Document name (e.g., 'Nigeria Tax Act 2025')")
     parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"Words per chunk (default: {CHUNK_SIZE})")
     parser.add_argument("--overlap", type=int, default=CHUNK_OVERLAP, help=f"Overlap words (default: {CHUNK_OVERLAP})")
+    parser.add_argument(
+        "--onnx",
+        action="store_true",
+        help="Embed with an int8-quantised ONNX Runtime export (CPU hosts; needs optimum[onnxruntime])",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep the model loaded and ingest document paths read from stdin, one per line",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-ingest even if the file and settings match the last ingestion",
+    )
     args = parser.parse_args()
 
-    file_path = args.file
-    if not os.path.exists(file_path):
-        print(f"Error: File not found: {file_path}")
-        sys.exit(1)
-
-    print(f"📄 Extracting text from: {file_path}")
-    text = extract_text(file_path)
-    print(f"   Extracted {len(text):,} characters")
-
-    print(f"✂️  Chunking text (size={args.chunk_size}, overlap={args.overlap})")
-    chunks = chunk_text(text, chunk_size=args.chunk_size, overlap=args.overlap)
-    print(f"   Created {len(chunks)} chunks")
+    if not args.serve and not (args.file and args.name):
+        parser.error("--file and --name are required unless --serve is given")
 
-    print(f"🧠 Generating embeddings with {EMBEDDING_MODEL}")
-    model = SentenceTransformer(EMBEDDING_MODEL)
-    chunks = embed_chunks(chunks, model)
-    print(f"   Embedded {len(chunks)} chunks (dim={len(chunks[0]['embedding'])})")
+    if not args.serve and not os.path.exists(args.file):
+        print(f"Error: File not found: {args.file}")
+        sys.exit(1)
 
-    print(f"☁️  Uploading to Supabase as '{args.name}'")
-    upload_to_supabase(chunks, args.name)
-    print(f"✅ Done! {len(chunks)} chunks ingested for '{args.name}'")
+    model = OnnxEncoder() if args.onnx else load_model()
+    # Started once so --serve keeps its GPU workers alive across documents.
+    gpu_pool = start_gpu_pool(model)
+    try:
+        if args.serve:
+            serve(args, model, gpu_pool)
+        else:
+            ingest_file(
+                args.file, args.name, model, chunk_size=args.chunk_size, overlap=args.overlap,
+                force=args.force, gpu_pool=gpu_pool,
+            )
+    finally:
+        if gpu_pool is not None:
+            model.stop_multi_process_pool(gpu_pool)
 
 
 if __name__ == "__main__":
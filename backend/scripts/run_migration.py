@@ -6,9 +6,12 @@ Usage:
     python -m scripts.run_migration
 """
 
+import atexit
 import os
+import re
 import sys
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -20,6 +23,17 @@ MIGRATION_FILE = os.path.join(
     os.path.dirname(__file__), "..", "supabase", "migrations", "001_initial_schema.sql"
 )
 
+# A statement is a run of literals, comments and other non-";" text, plus its ";".
+_STATEMENT = re.compile(
+    r"""(?:\$((?:[A-Za-z_]\w*)?)\$.*?\$\1\$|'(?:[^']|'')*'|"(?:[^"]|"")*"|--[^\n]*|[^;'"$-]+|[$-])+;?""",
+    re.DOTALL,
+)
+_LEADING_COMMENTS = re.compile(r"(?:\s*--[^\n]*)*\s*")
+
+# One pooled keep-alive client, so statement-at-a-time runs reuse a single TLS connection.
+_CLIENT = httpx.Client(timeout=60)
+atexit.register(_CLIENT.close)
+
 
 def run_sql(sql: str) -> dict:
     """Execute SQL via Supabase's pg_net / REST SQL endpoint."""
@@ -32,32 +46,22 @@ def run_sql(sql: str) -> dict:
 
     # Try the rpc approach first (requires a helper function)
     # Fall back to executing statements one by one via postgrest
-    response = httpx.post(url, json={"query": sql}, headers=headers, timeout=60)
+    response = _CLIENT.post(url, content=orjson.dumps({"query": sql}), headers=headers)
     return {"status": response.status_code, "body": response.text}
 
 
 def split_statements(sql: str) -> list[str]:
-    """Split SQL into individual statements, handling multi-line statements."""
+    """
+    Split SQL into individual statements in one regex pass. Semicolons inside
+    string literals, quoted identifiers, comments and dollar-quoted
+    ($$ / $tag$) function bodies do not end a statement.
+    """
     statements = []
-    current = []
-
-    for line in sql.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("--") or not stripped:
-            continue
-        current.append(line)
-        if stripped.endswith(";"):
-            stmt = "\n".join(current).strip()
-            if stmt:
-                statements.append(stmt)
-            current = []
-
-    # Handle $$ delimited functions
-    if current:
-        stmt = "\n".join(current).strip()
-        if stmt:
+    for match in _STATEMENT.finditer(sql):
+        stmt = match.group(0)
+        stmt = stmt[_LEADING_COMMENTS.match(stmt).end():].rstrip()
+        if stmt and stmt != ";":
             statements.append(stmt)
-
     return statements
 
 
@@ -0,0 +1,12 @@
+-- ============================================================
+-- Kudi Ecosystem — Composite indexes for per-user report queries
+-- Supabase (PostgreSQL) Migration
+-- ============================================================
+
+-- Transaction lists filter by user and type within a date range
+CREATE INDEX IF NOT EXISTS idx_transactions_user_type_date
+  ON transactions(user_id, transaction_type, transaction_date);
+
+-- Tax history is read per user, year and tax type
+CREATE INDEX IF NOT EXISTS idx_tax_calculations_user_year_type
+  ON tax_calculations(user_id, year, tax_type);
@@ -0,0 +1,40 @@
+-- ============================================================
+-- Kudi Ecosystem — Time-ordered (v7) UUID primary keys
+-- Supabase (PostgreSQL) Migration
+-- ============================================================
+
+-- RFC 9562 UUIDv7: 48-bit Unix millisecond timestamp followed by random bits.
+-- Built from a v4 UUID by overwriting the first 6 bytes and flipping the
+-- version nibble from 0100 to 0111; the variant bits are already correct.
+-- New rows land on the rightmost B-tree page instead of a random leaf, and
+-- ORDER BY id roughly follows insertion time.
+CREATE OR REPLACE FUNCTION uuid_generate_v7()
+RETURNS UUID AS $$
+BEGIN
+  RETURN encode(
+    set_bit(
+      set_bit(
+        overlay(
+          uuid_send(gen_random_uuid())
+          PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+          FROM 1 FOR 6
+        ),
+        52, 1
+      ),
+      53, 1
+    ),
+    'hex'
+  )::uuid;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+ALTER TABLE users ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE user_profiles ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE transactions ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE tax_calculations ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE tax_deductions ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE compliance_items ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE chat_conversations ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE chat_messages ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE subscriptions ALTER COLUMN id SET DEFAULT uuid_generate_v7();
+ALTER TABLE payment_history ALTER COLUMN id SET DEFAULT uuid_generate_v7();
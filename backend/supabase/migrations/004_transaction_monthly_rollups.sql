@@ -0,0 +1,122 @@
+-- ============================================================
+-- Kudi Ecosystem — Per-user monthly transaction rollups
+-- Supabase (PostgreSQL) Migration
+-- ============================================================
+
+-- Cache of SUM(amount_ngn) / COUNT(*) per user, month, type and category.
+-- transactions stays the source of truth; a trigger keeps this table in step
+-- so summaries read O(months x categories) rows instead of every transaction.
+CREATE TABLE transaction_monthly_rollups (
+  user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  year INTEGER NOT NULL,
+  month INTEGER NOT NULL,
+  transaction_type transaction_type_enum NOT NULL,
+  category VARCHAR(50) NOT NULL,
+  total_ngn DOUBLE PRECISION NOT NULL DEFAULT 0.0,
+  transaction_count INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (user_id, year, month, transaction_type, category)
+);
+
+ALTER TABLE transaction_monthly_rollups ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own rollups" ON transaction_monthly_rollups
+  FOR SELECT USING (user_id IN (SELECT id FROM users WHERE supabase_id = auth.uid()::text));
+
+CREATE OR REPLACE FUNCTION public.apply_transaction_rollup(
+  p_user_id UUID,
+  p_date DATE,
+  p_type public.transaction_type_enum,
+  p_category TEXT,
+  p_amount DOUBLE PRECISION,
+  p_count INTEGER
+)
+RETURNS VOID AS $$
+BEGIN
+  INSERT INTO public.transaction_monthly_rollups AS r
+    (user_id, year, month, transaction_type, category, total_ngn, transaction_count)
+  VALUES (
+    p_user_id,
+    EXTRACT(YEAR FROM p_date)::int,
+    EXTRACT(MONTH FROM p_date)::int,
+    p_type,
+    p_category,
+    p_amount,
+    p_count
+  )
+  ON CONFLICT (user_id, year, month, transaction_type, category) DO UPDATE
+  SET total_ngn = r.total_ngn + EXCLUDED.total_ngn,
+      transaction_count = r.transaction_count + EXCLUDED.transaction_count;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Only the trigger below may call this; otherwise PostgREST would expose it as
+-- /rpc/apply_transaction_rollup and let any caller rewrite any user's rollups.
+REVOKE EXECUTE ON FUNCTION public.apply_transaction_rollup(
+  UUID, DATE, public.transaction_type_enum, TEXT, DOUBLE PRECISION, INTEGER
+) FROM PUBLIC, anon, authenticated;
+
+CREATE OR REPLACE FUNCTION public.maintain_transaction_rollup()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM public.apply_transaction_rollup(
+      OLD.user_id,
+      OLD.transaction_date,
+      OLD.transaction_type,
+      COALESCE(
+        CASE WHEN OLD.transaction_type = 'income' THEN OLD.income_category::text ELSE OLD.expense_category::text END,
+        'other'
+      ),
+      -OLD.amount_ngn,
+      -1
+    );
+  END IF;
+
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM public.apply_transaction_rollup(
+      NEW.user_id,
+      NEW.transaction_date,
+      NEW.transaction_type,
+      COALESCE(
+        CASE WHEN NEW.transaction_type = 'income' THEN NEW.income_category::text ELSE NEW.expense_category::text END,
+        'other'
+      ),
+      NEW.amount_ngn,
+      1
+    );
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Backfill and attach the trigger in one transaction while writes to
+-- transactions are blocked, so no row is counted twice or missed in between.
+BEGIN;
+
+LOCK TABLE transactions IN SHARE ROW EXCLUSIVE MODE;
+
+INSERT INTO transaction_monthly_rollups
+  (user_id, year, month, transaction_type, category, total_ngn, transaction_count)
+SELECT
+  user_id,
+  EXTRACT(YEAR FROM transaction_date)::int,
+  EXTRACT(MONTH FROM transaction_date)::int,
+  transaction_type,
+  COALESCE(
+    CASE WHEN transaction_type = 'income' THEN income_category::text ELSE expense_category::text END,
+    'other'
+  ),
+  SUM(amount_ngn),
+  COUNT(*)
+FROM transactions
+GROUP BY 1, 2, 3, 4, 5
+ON CONFLICT (user_id, year, month, transaction_type, category) DO UPDATE
+SET total_ngn = EXCLUDED.total_ngn,
+    transaction_count = EXCLUDED.transaction_count;
+
+CREATE TRIGGER maintain_monthly_rollup
+  AFTER INSERT OR UPDATE OR DELETE ON transactions
+  FOR EACH ROW EXECUTE FUNCTION public.maintain_transaction_rollup();
+
+COMMIT;
@@ -0,0 +1,9 @@
+-- ============================================================
+-- Kudi Ecosystem — Index subscriptions by provider subscription code
+-- Supabase (PostgreSQL) Migration
+-- ============================================================
+
+-- The subscription.disable webhook looks rows up by the provider's code.
+-- Per-user lookups already use the UNIQUE (user_id) index.
+CREATE INDEX IF NOT EXISTS idx_subscriptions_provider_subscription_id
+  ON subscriptions(provider_subscription_id);
@@ -0,0 +1,20 @@
+-- ============================================================
+-- Kudi Ecosystem — Track ingested RAG source documents
+-- Supabase (PostgreSQL) Migration
+-- ============================================================
+
+-- One row per document_embeddings.document_name, recording the SHA-256 of
+-- the source file and the chunking / embedding settings it was ingested with,
+-- so scripts/ingest_documents.py can skip re-runs that would change nothing.
+CREATE TABLE ingested_documents (
+  name TEXT PRIMARY KEY,
+  sha256 CHAR(64) NOT NULL,
+  chunk_size INTEGER NOT NULL,
+  chunk_overlap INTEGER NOT NULL,
+  embedding_backend TEXT NOT NULL,
+  chunk_count INTEGER NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Written only by the ingestion script with the service role key.
+ALTER TABLE ingested_documents ENABLE ROW LEVEL SECURITY;
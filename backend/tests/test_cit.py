@@ -9,11 +9,12 @@ CIT Rates:
   - Minimum effective rate: 15% (MNEs / turnover ≥ ₦20B)
 """
 
+import numpy as np
 import pytest
 from app.core.tax_rules.cit import CITCalculator, CompanySize
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def calc():
     return CITCalculator()
 
@@ -25,6 +26,9 @@ class TestCompanyClassification:
     def test_small_company_boundary(self, calc):
         assert calc.classify_company(25_000_000) == CompanySize.SMALL
 
+    def test_medium_company_boundary(self, calc):
+        assert calc.classify_company(100_000_000) == CompanySize.MEDIUM
+
     def test_medium_company(self, calc):
         assert calc.classify_company(50_000_000) == CompanySize.MEDIUM
 
@@ -63,3 +67,29 @@ class TestCITCalculation:
         result = calc.calculate(gross_profit=10_000_000, annual_turnover=50_000_000)
         expected_rate = (result.total_tax_liability / result.assessable_profit) * 100
         assert result.effective_rate == round(expected_rate, 2)
+
+    def test_cached_result_not_shared_with_callers(self, calc):
+        calc.calculate(gross_profit=50_000_000, annual_turnover=200_000_000).breakdown["extra"] = 1
+        assert "extra" not in calc.calculate(gross_profit=50_000_000, annual_turnover=200_000_000).breakdown
+
+
+class TestCITBatch:
+    def test_batch_matches_scalar(self, calc):
+        rows = [
+            (10_000_000, 0, 20_000_000, False),
+            (10_000_000, 3_000_000, 50_000_000, False),
+            (1_000_000_000, 0, 25_000_000_000, False),
+            (5_000_000, 0, 10_000_000, True),
+            (0, 0, 200_000_000, True),
+        ]
+        profits, deductions, turnovers, mne = (np.array(col) for col in zip(*rows))
+        cit, levy, minimum = calc.calculate_batch(profits, deductions, turnovers, mne)
+        for i, row in enumerate(rows):
+            expected = calc.calculate(*row)
+            assert cit[i] == expected.cit_liability
+            assert levy[i] == expected.development_levy
+            assert minimum[i] == expected.minimum_tax_applied
+
+    def test_batch_negative_profit_raises(self, calc):
+        with pytest.raises(ValueError):
+            calc.calculate_batch(np.array([-1.0]))
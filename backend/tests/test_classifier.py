@@ -0,0 +1,94 @@
+"""
+Tests for the rule-based Transaction Classifier.
+Validates keyword precedence: capital keywords first, then income or
+expense keywords depending on the direction of the transaction.
+"""
+
+import pytest
+from app.core.classifier import TransactionClassifier, TransactionClassification
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return TransactionClassifier()
+
+
+class TestKeywordClassification:
+    def test_salary_credit(self, classifier):
+        result = classifier.classify("Monthly SALARY payment", 500_000)
+        assert result.classification == TransactionClassification.INCOME_SALARY
+        assert result.is_income is True
+        assert result.suggested_category == "salary"
+
+    def test_freelance_is_vat_and_wht_applicable(self, classifier):
+        result = classifier.classify("Upwork payout", 200_000)
+        assert result.classification == TransactionClassification.INCOME_FREELANCE
+        assert result.is_vat_applicable is True
+        assert result.is_wht_applicable is True
+
+    def test_expense_debit(self, classifier):
+        result = classifier.classify("Office chairs", 80_000, is_credit=False)
+        assert result.classification == TransactionClassification.EXPENSE_BUSINESS
+        assert result.suggested_category == "business"
+
+    def test_unmatched_credit_is_other_income(self, classifier):
+        result = classifier.classify("xyz", 1_000)
+        assert result.classification == TransactionClassification.INCOME_OTHER
+        assert result.confidence == 0.3
+
+    def test_unmatched_debit_is_personal_expense(self, classifier):
+        result = classifier.classify("xyz", 1_000, is_credit=False)
+        assert result.classification == TransactionClassification.EXPENSE_PERSONAL
+
+    def test_unmatched_transfer(self, classifier):
+        result = classifier.classify("TRF FROM JOHN DOE", 50_000)
+        assert result.classification == TransactionClassification.TRANSFER
+        assert result.is_income is False
+        assert result.is_taxable is False
+
+
+class TestKeywordPrecedence:
+    def test_capital_beats_income(self, classifier):
+        result = classifier.classify("salary deposit", 100_000)
+        assert result.classification == TransactionClassification.CAPITAL_INFLOW
+        assert result.is_capital is True
+
+    def test_capital_outflow_on_debit(self, classifier):
+        result = classifier.classify("loan repayment", 100_000, is_credit=False)
+        assert result.classification == TransactionClassification.CAPITAL_OUTFLOW
+
+    def test_earliest_keyword_wins_not_earliest_position(self, classifier):
+        # "deposit" appears first in the text but "loan received" is listed first
+        result = classifier.classify("deposit of loan received", 100_000)
+        assert result.reasoning == "Matched capital keyword: 'loan received'"
+
+    def test_income_keyword_order(self, classifier):
+        # "contract" (freelance) precedes "sales" (business) in INCOME_KEYWORDS
+        result = classifier.classify("sales contract", 100_000)
+        assert result.classification == TransactionClassification.INCOME_FREELANCE
+
+    def test_income_keyword_beats_transfer_marker(self, classifier):
+        result = classifier.classify("TRF salary march", 500_000)
+        assert result.classification == TransactionClassification.INCOME_SALARY
+
+
+class TestBatchClassification:
+    def test_batch_matches_single(self, classifier):
+        descriptions = ["Salary", "Uber trip", "Salary", "loan received", "xyz"]
+        credits = [True, False, True, True, False]
+        batch = classifier.classify_batch(descriptions, credits)
+        single = [classifier.classify(d, 0.0, c) for d, c in zip(descriptions, credits)]
+        assert batch == single
+
+    def test_empty_batch(self, classifier):
+        assert classifier.classify_batch([], []) == []
+
+
+class TestCapitalVsProfit:
+    def test_capital(self, classifier):
+        assert classifier.is_capital_vs_profit("Equity funding round", 1)["is_capital"] is True
+
+    def test_profit(self, classifier):
+        result = classifier.is_capital_vs_profit("Consulting fee", 1)
+        assert result["is_capital"] is False
+        assert result["is_profit"] is True
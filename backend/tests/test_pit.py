@@ -11,11 +11,12 @@ Tax Brackets:
   (f) Above ₦50,000,000 at 25%
 """
 
+import numpy as np
 import pytest
 from app.core.tax_rules.pit import PITCalculator, Deductions
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def calc():
     return PITCalculator()
 
@@ -170,6 +171,10 @@ class TestPITPAYE:
 class TestPITEdgeCases:
     """Test edge cases."""
 
+    def test_cached_result_not_shared_with_callers(self, calc):
+        calc.calculate(5_000_000, Deductions(pension=1)).deduction_details["pension"] = 999
+        assert calc.calculate(5_000_000, Deductions(pension=1)).deduction_details["pension"] == 1
+
     def test_negative_income_raises(self, calc):
         with pytest.raises(ValueError):
             calc.calculate(-1)
@@ -185,3 +190,28 @@ class TestPITEdgeCases:
     def test_effective_rate_reasonable(self, calc):
         result = calc.calculate(10_000_000)
         assert 0 < result.effective_rate < 25
+
+
+class TestPITBatch:
+    """Test the vectorised batch path against the scalar calculator."""
+
+    def test_batch_matches_scalar(self, calc):
+        incomes = [0, 500_000, 840_000, 3_000_000, 12_000_000, 25_000_000, 50_000_000, 75_000_000]
+        deductions = [0, 0, 0, 200_000, 1_000_000, 0, 2_500_000, 4_000_000]
+        batch = calc.calculate_batch(np.array(incomes), np.array(deductions))
+        expected = [calc.calculate(g, Deductions(pension=d)).tax_liability for g, d in zip(incomes, deductions)]
+        assert batch.tolist() == expected
+
+    def test_batch_matches_scalar_on_half_kobo_ties(self, calc):
+        incomes = [59_783_700.86, 63_383_592.86, 79_369_835.06]
+        batch = calc.calculate_batch(np.array(incomes))
+        assert batch.tolist() == [calc.calculate(g).tax_liability for g in incomes]
+
+    def test_batch_matches_scalar_on_random_sample(self, calc):
+        incomes = np.random.default_rng(0).uniform(0, 100_000_000, 2_000).round(2)
+        batch = calc.calculate_batch(incomes)
+        assert batch.tolist() == [calc.calculate(g, include_breakdown=False).tax_liability for g in incomes.tolist()]
+
+    def test_batch_negative_income_raises(self, calc):
+        with pytest.raises(ValueError):
+            calc.calculate_batch(np.array([1_000_000, -1]))
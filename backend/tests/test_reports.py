@@ -0,0 +1,47 @@
+"""
+Tests for the Report Generator.
+Figures must round exactly as the built-in round() does, including on half-kobo ties.
+"""
+
+import numpy as np
+import pytest
+from app.core.reports import ReportGenerator
+
+
+@pytest.fixture(scope="module")
+def report_gen():
+    return ReportGenerator()
+
+
+class TestTaxSummaryRounding:
+    def test_half_kobo_tie_matches_builtin_round(self, report_gen):
+        report = report_gen.generate_tax_summary(
+            user_name="Ada",
+            user_type="individual",
+            year=2025,
+            income_data=[{"category": "salary", "amount": 1234.565}],
+            deduction_data=[],
+            tax_results={"pit": 10.005},
+            generated_at="2025-01-01T00:00:00",
+        )
+        assert report.total_income == round(1234.565, 2) == 1234.57
+        assert report.taxable_income == round(1234.565, 2)
+        assert report.pit_liability == round(10.005, 2)
+
+    def test_totals_match_sequential_sum(self, report_gen):
+        rng = np.random.default_rng(1)
+        for _ in range(500):
+            amounts = rng.uniform(0, 1_000_000, rng.integers(1, 40)).round(3).tolist()
+            expected = 0.0
+            for amount in amounts:
+                expected += amount
+            report = report_gen.generate_tax_summary(
+                user_name="Ada",
+                user_type="individual",
+                year=2025,
+                income_data=[{"category": "salary", "amount": a} for a in amounts],
+                deduction_data=[{"type": "pension", "amount": a} for a in amounts],
+                tax_results={},
+                generated_at="2025-01-01T00:00:00",
+            )
+            assert report.total_income == report.total_deductions == round(expected, 2)
@@ -0,0 +1,41 @@
+"""
+Tests for the migration runner's SQL statement splitter.
+"""
+
+from pathlib import Path
+
+from scripts.run_migration import split_statements
+
+MIGRATIONS = Path(__file__).resolve().parent.parent / "supabase" / "migrations"
+
+
+class TestSplitStatements:
+    def test_splits_on_semicolons(self):
+        assert split_statements("SELECT 1;\nSELECT 2;") == ["SELECT 1;", "SELECT 2;"]
+
+    def test_skips_comments(self):
+        sql = "-- header\nSELECT 1; -- trailing; note\n-- only a comment\n"
+        assert split_statements(sql) == ["SELECT 1;"]
+
+    def test_quoted_semicolons(self):
+        sql = "INSERT INTO t VALUES ('a;b', 'it''s;'); SELECT \"x;y\" FROM t;"
+        assert split_statements(sql) == ["INSERT INTO t VALUES ('a;b', 'it''s;');", 'SELECT "x;y" FROM t;']
+
+    def test_dollar_quoted_function_body(self):
+        sql = (
+            "CREATE FUNCTION f() RETURNS void AS $$ BEGIN PERFORM 1; END; $$ LANGUAGE plpgsql;\n"
+            "CREATE FUNCTION g() RETURNS void AS $body$ BEGIN PERFORM 2; END; $body$ LANGUAGE plpgsql;"
+        )
+        statements = split_statements(sql)
+        assert len(statements) == 2
+        assert statements[0].endswith("$$ LANGUAGE plpgsql;")
+        assert statements[1].endswith("$body$ LANGUAGE plpgsql;")
+
+    def test_unterminated_last_statement(self):
+        assert split_statements("SELECT 1;\nSELECT 2") == ["SELECT 1;", "SELECT 2"]
+
+    def test_migration_functions_stay_whole(self):
+        sql = (MIGRATIONS / "004_transaction_monthly_rollups.sql").read_text()
+        functions = [s for s in split_statements(sql) if s.startswith("CREATE OR REPLACE FUNCTION")]
+        assert len(functions) == 2
+        assert all(s.count("$$") == 2 for s in functions)
@@ -4,17 +4,18 @@ VAT: Section 148 — 7.5%
 WHT: Rates vary by payment type and recipient type.
 """
 
+import numpy as np
 import pytest
-from app.core.tax_rules.vat import VATCalculator, VATCategory
+from app.core.tax_rules.vat import VATCalculator, VATCategory, VATSupply, VAT_CATEGORY_CODES
 from app.core.tax_rules.wht import WHTCalculator, WHTPaymentType, RecipientType
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def vat_calc():
     return VATCalculator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def wht_calc():
     return WHTCalculator()
 
@@ -61,6 +62,56 @@ class TestVAT:
         assert result.input_vat == 2_250
         assert result.net_vat_payable == 5_250
 
+    def test_array_calculation_matches_batch(self, vat_calc):
+        supplies = [
+            {"description": "Service A", "amount": 8_905_833, "category": "standard"},
+            {"description": "Food", "amount": 50_000, "category": "basic_food_items"},
+            {"description": "Export", "amount": 20_000, "category": "non_oil_exports"},
+        ]
+        expected = vat_calc.calculate(output_supplies=supplies)
+        result = vat_calc.calculate_from_arrays(
+            np.array([s["amount"] for s in supplies], dtype=float),
+            np.array([VAT_CATEGORY_CODES[vat_calc.classify_supply(s["category"])] for s in supplies]),
+        )
+        assert result.output_vat == expected.output_vat
+        assert result.zero_rated_supplies == 20_000
+        assert result.line_items == ()
+
+    def test_typed_supplies_match_batch(self, vat_calc):
+        supplies = [
+            {"description": "Service A", "amount": 100_000, "category": "standard"},
+            {"description": "Food", "amount": 50_000, "category": "basic_food_items"},
+        ]
+        purchases = [{"description": "Materials", "amount": 30_000, "category": "standard"}]
+        expected = vat_calc.calculate(output_supplies=supplies, input_purchases=purchases)
+        result = vat_calc.calculate_supplies(
+            [VATSupply(s["amount"], vat_calc.classify_supply(s["category"]), s["description"]) for s in supplies],
+            [VATSupply(30_000)],
+        )
+        assert result.net_vat_payable == expected.net_vat_payable
+        assert result.line_items == expected.line_items
+
+    def test_array_totals_match_running_sums(self, vat_calc):
+        rng = np.random.default_rng(0)
+        for _ in range(500):
+            n = int(rng.integers(1, 40))
+            amounts = rng.uniform(0, 1_000_000, n).round(3)
+            codes = rng.integers(0, 3, n)
+            totals = [0.0, 0.0, 0.0]
+            total = output_vat = 0.0
+            for amount, code in zip(amounts.tolist(), codes.tolist()):
+                total += amount
+                totals[code] += amount
+                if code == VAT_CATEGORY_CODES[VATCategory.STANDARD]:
+                    output_vat += round(amount * 0.075, 2)
+            result = vat_calc.calculate_from_arrays(amounts, codes, amounts, codes)
+            assert result.total_supplies == round(total, 2)
+            assert [result.taxable_supplies, result.exempt_supplies, result.zero_rated_supplies] == [
+                round(totals[VAT_CATEGORY_CODES[c]], 2)
+                for c in (VATCategory.STANDARD, VATCategory.EXEMPT, VATCategory.ZERO_RATED)
+            ]
+            assert result.output_vat == result.input_vat == round(output_vat, 2)
+
 
 class TestWHT:
     def test_contract_company(self, wht_calc):
@@ -107,3 +158,26 @@ class TestWHT:
         assert result.total_gross == 1_500_000
         assert result.total_wht == 125_000
         assert result.total_net == 1_375_000
+
+    def test_batch_line_items_match_single(self, wht_calc):
+        payments = [
+            {"amount": 333_333.33, "payment_type": "consultancy", "recipient_type": "individual"},
+            {"amount": 1_234.5, "payment_type": "rent"},
+            {"amount": 70_000, "payment_type": "consultancy", "recipient_type": "company"},
+        ]
+        result = wht_calc.calculate_batch(payments)
+        expected = tuple(
+            wht_calc.calculate_single(
+                p["amount"], WHTPaymentType(p["payment_type"]), RecipientType(p.get("recipient_type", "company")),
+            )
+            for p in payments
+        )
+        assert result.line_items == expected
+        assert list(result.breakdown) == ["consultancy", "rent"]
+        assert result.breakdown["consultancy"]["rate"] == 5.0
+
+    def test_batch_summary_only(self, wht_calc):
+        payments = [{"amount": 1_000_000, "payment_type": "rent"}]
+        result = wht_calc.calculate_batch(payments, include_line_items=False)
+        assert result.line_items == ()
+        assert result.total_wht == wht_calc.calculate_batch(payments).total_wht